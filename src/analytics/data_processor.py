@@ -7,17 +7,340 @@ for visualization and statistical analysis.
 
 import os
 import re
-import json
-import glob
+import hashlib
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 import numpy as np
 from PyQt5.QtWidgets import QFileDialog, QMessageBox, QProgressDialog
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QThread, QEventLoop, pyqtSignal
+
+from src.utils.file_io import read_json_file, list_json_files, dump_json_bytes, write_file_atomic
+
+try:
+    import ijson  # Optional: stream just the fields the scan needs
+except ImportError:
+    ijson = None
+
+_QUESTION_RE = re.compile(r"Question\s+(\d+)")
+
+# Per-directory scan results, reused while a file's mtime and size are unchanged
+SCAN_CACHE_DIR = os.path.join(tempfile.gettempdir(), "rubric_grader_cache")
+
+# Files are read and parsed on a small thread pool (mostly I/O-bound)
+_SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Fields read by the analytics scan (ijson prefixes)
+_SCAN_TOP_LEVEL_FIELDS = frozenset(("assignment_name", "total_awarded", "total_possible"))
+_SCAN_CRITERION_FIELDS = {
+    "criteria.item.title": "title",
+    "criteria.item.points_awarded": "points_awarded",
+    "criteria.item.points_possible": "points_possible",
+}
+
+
+@dataclass
+class QuestionStats:
+    """Running aggregate of one question's scores across assessments."""
+    title: str = ""
+    n: int = 0
+    total: float = 0.0
+    total_sq: float = 0.0
+    max_points: float = 0
+    scores: list = field(default_factory=list)
+
+    def add(self, awarded, possible):
+        """Record one awarded score."""
+        self.n += 1
+        self.total += awarded
+        self.total_sq += awarded * awarded
+        self.scores.append(awarded)
+        if possible > self.max_points:
+            self.max_points = possible
+
+    @property
+    def mean(self):
+        return self.total / self.n if self.n else 0.0
+
+    @property
+    def std(self):
+        if not self.n:
+            return 0.0
+        variance = self.total_sq / self.n - self.mean ** 2
+        return max(variance, 0.0) ** 0.5
+
+    def to_dict(self):
+        """Return the question entry in the format used by AnalyticsDialog."""
+        scores = np.fromiter(self.scores, dtype=float, count=self.n)
+        if self.max_points > 0:
+            percentages = scores * (100.0 / self.max_points)
+        else:
+            percentages = np.zeros_like(scores)
+        return {
+            "scores": scores,
+            "percentages": percentages,
+            "max_points": self.max_points,
+            "num_students": self.n,
+            "title": self.title,
+        }
+
+
+class AssessmentScanWorker(QObject):
+    """
+    Worker that parses assessment files off the GUI thread.
+
+    Move it to a QThread and connect ``progress`` / ``finished`` with queued
+    connections; ``cancel`` may be called directly from the GUI thread.
+    """
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(dict)
+
+    def __init__(self, assessment_files, directory=None):
+        super().__init__()
+        self.assessment_files = assessment_files
+        self.directory = directory
+        self.result = None
+        self._canceled = False
+
+    def cancel(self):
+        """Ask the worker to stop after the current file."""
+        self._canceled = True
+
+    def run(self):
+        """
+        Scan all files and emit the aggregated data.
+
+        ``finished`` is always emitted, since the caller waits for it; if
+        the scan raises, it carries an empty dict and ``result`` stays None.
+        """
+        try:
+            cache = load_scan_cache(self.directory) if self.directory else None
+            self.result = scan_assessment_files(
+                self.assessment_files,
+                progress_callback=self.progress.emit,
+                is_canceled=lambda: self._canceled,
+                cache=cache
+            )
+            if cache is not None and not self._canceled:
+                save_scan_cache(self.directory, cache)
+        except Exception as e:
+            print(f"Error scanning assessments: {str(e)}")
+        finally:
+            self.finished.emit(self.result or {})
+
+
+def load_scan_fields(file_path):
+    """
+    Load the parts of an assessment file used by the analytics scan.
+
+    With ijson installed the file is streamed and only the assignment name,
+    totals and criterion title/points are kept, so levels, comments and
+    other unused keys are never materialized. Otherwise the whole file is
+    parsed.
+
+    Args:
+        file_path (str): Path to the assessment JSON file
+
+    Returns:
+        dict: Assessment data (possibly reduced to the scanned fields)
+    """
+    if ijson is None:
+        return read_json_file(file_path)
+
+    assessment = {}
+    criteria = []
+    criterion = None
+    with open(file_path, 'rb') as file:
+        for prefix, event, value in ijson.parse(file, use_float=True):
+            if prefix == "criteria.item":
+                if event == "start_map":
+                    criterion = {}
+                elif event == "end_map":
+                    criteria.append(criterion)
+                    criterion = None
+            elif criterion is not None:
+                field = _SCAN_CRITERION_FIELDS.get(prefix)
+                if field:
+                    criterion[field] = value
+            elif prefix in _SCAN_TOP_LEVEL_FIELDS:
+                assessment[prefix] = value
+
+    assessment["criteria"] = criteria
+    return assessment
+
+
+def summarize_assessment(assessment):
+    """
+    Reduce a parsed assessment to what the analytics scan aggregates.
+
+    Args:
+        assessment (dict): Assessment data
+
+    Returns:
+        dict: Assignment name, [question, title, awarded, possible] rows for
+        each question criterion, and the overall percentage (or None)
+    """
+    questions = []
+    for criterion in assessment.get("criteria", []):
+        title = criterion.get("title", "")
+        match = _QUESTION_RE.search(title)
+        if match:
+            questions.append([match.group(1), title,
+                              criterion.get("points_awarded", 0),
+                              criterion.get("points_possible", 0)])
+    return {
+        "assignment_name": assessment.get("assignment_name", ""),
+        "questions": questions,
+        "overall": calculate_overall_percentage(assessment),
+    }
+
+
+def _scan_cache_path(directory):
+    """Return the cache file used for an assessment directory."""
+    digest = hashlib.sha1(os.path.abspath(directory).encode('utf-8')).hexdigest()
+    return os.path.join(SCAN_CACHE_DIR, f"{digest}.json")
+
+
+def load_scan_cache(directory):
+    """
+    Load the cached per-file summaries for an assessment directory.
+
+    Args:
+        directory (str): Assessment directory
+
+    Returns:
+        dict: {path: [mtime_ns, size, summary]}, empty if there is no usable cache
+    """
+    try:
+        cache = read_json_file(_scan_cache_path(directory))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_scan_cache(directory, cache):
+    """
+    Write the per-file summaries for an assessment directory.
+
+    Failures are ignored; the next scan simply re-parses the files.
+
+    Args:
+        directory (str): Assessment directory
+        cache (dict): {path: [mtime_ns, size, summary]}
+    """
+    path = _scan_cache_path(directory)
+    try:
+        os.makedirs(SCAN_CACHE_DIR, exist_ok=True)
+        write_file_atomic(path, dump_json_bytes(cache))
+    except OSError as e:
+        print(f"Error saving analytics cache: {str(e)}")
+
+
+def _summarize_file(file_path, cache):
+    """
+    Return a file's summary and its new cache entry.
+
+    The entry is None when the cached summary was reused (or no cache is
+    used). The cache is only read here, so this is safe to call from the
+    scan thread pool.
+    """
+    if cache is None:
+        return summarize_assessment(load_scan_fields(file_path)), None
+
+    stat = os.stat(file_path)
+    entry = cache.get(file_path)
+    if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        return entry[2], None
+
+    summary = summarize_assessment(load_scan_fields(file_path))
+    return summary, [stat.st_mtime_ns, stat.st_size, summary]
+
+
+def scan_assessment_files(assessment_files, progress_callback=None, is_canceled=None, cache=None):
+    """
+    Parse assessment files and aggregate question and overall scores.
+
+    Args:
+        assessment_files (list): Paths to assessment JSON files
+        progress_callback (callable, optional): Called as (done, total)
+        is_canceled (callable, optional): Returns True to stop scanning early
+        cache (dict, optional): Per-file summaries from load_scan_cache;
+            unchanged files are taken from it and the rest are added to it
+
+    Returns:
+        dict: Dictionary with aggregated assessment data
+    """
+    question_stats = defaultdict(QuestionStats)
+    assignment_name = ""
+    overall_scores = []
+    total = len(assessment_files)
+
+    if cache is not None:
+        # Forget files that are no longer part of the scan
+        wanted = set(assessment_files)
+        for stale in [path for path in cache if path not in wanted]:
+            del cache[stale]
+
+    # Parse files concurrently, but merge them in order on this thread
+    executor = ThreadPoolExecutor(max_workers=max(1, min(_SCAN_MAX_WORKERS, total)))
+    futures = [executor.submit(_summarize_file, path, cache) for path in assessment_files]
+
+    for i, (file_path, future) in enumerate(zip(assessment_files, futures)):
+        if progress_callback:
+            progress_callback(i, total)
+        if is_canceled and is_canceled():
+            break
+
+        try:
+            summary, entry = future.result()
+            if entry is not None:
+                cache[file_path] = entry
+
+            # Use the assignment name from the first valid assessment
+            if not assignment_name:
+                assignment_name = summary["assignment_name"]
+
+            # Process question data
+            for question, title, awarded, possible in summary["questions"]:
+                stats = question_stats[question]
+                if not stats.n:
+                    stats.title = title
+                stats.add(awarded, possible)
+
+            if summary["overall"] is not None:
+                overall_scores.append(summary["overall"])
+
+        except Exception as e:
+            print(f"Error processing {file_path}: {str(e)}")
+
+    # Drop files not yet started if the scan was canceled
+    for future in futures:
+        future.cancel()
+    executor.shutdown(wait=True)
+
+    if progress_callback:
+        progress_callback(total, total)
+
+    return {
+        "question_data": {q: stats.to_dict() for q, stats in question_stats.items()},
+        "assignment_name": assignment_name,
+        "file_count": total,
+        "overall_data": {
+            "overall_scores": overall_scores,
+            "num_students": len(overall_scores)
+        }
+    }
 
 
 def collect_assessments(self):
     """
     Collect and process assessment data from a directory of JSON files.
 
+    The files are parsed on a background thread while the progress dialog
+    keeps the window responsive.
+
     Args:
         self: The parent window object (used for dialogs)
 
@@ -36,7 +359,7 @@ def collect_assessments(self):
         return None
 
     # Find all assessment JSON files in the directory
-    assessment_files = glob.glob(os.path.join(directory, "*.json"))
+    assessment_files = list_json_files(directory)
 
     if not assessment_files:
         QMessageBox.warning(
@@ -46,96 +369,56 @@ def collect_assessments(self):
         )
         return None
 
-    # Initialize data structures
-    question_data = {}
-    assignment_name = ""
-    total_students = len(assessment_files)
-
-    # Process each assessment file
     progress = QProgressDialog("Loading assessments...", "Cancel", 0, len(assessment_files), self)
     progress.setWindowTitle("Loading Assessments")
     progress.setWindowModality(Qt.WindowModal)
 
-    for i, file_path in enumerate(assessment_files):
-        progress.setValue(i)
-        if progress.wasCanceled():
-            break
-
-        try:
-            with open(file_path, 'r') as file:
-                assessment = json.load(file)
+    # Parse the files on a worker thread
+    thread = QThread()
+    worker = AssessmentScanWorker(assessment_files, directory)
+    worker.moveToThread(thread)
+    loop = QEventLoop()
 
-                # Use the assignment name from the first valid assessment
-                if not assignment_name and "assignment_name" in assessment:
-                    assignment_name = assessment["assignment_name"]
+    thread.started.connect(worker.run)
+    worker.progress.connect(progress.setValue, Qt.QueuedConnection)
+    worker.finished.connect(loop.quit, Qt.QueuedConnection)
+    progress.canceled.connect(worker.cancel, Qt.DirectConnection)
 
-                # Process question data
-                process_question_data(question_data, assessment)
-
-        except Exception as e:
-            print(f"Error processing {file_path}: {str(e)}")
+    thread.start()
+    loop.exec_()
+    thread.quit()
+    thread.wait()
 
     progress.setValue(len(assessment_files))
+    return worker.result
 
-    # Calculate overall scores
-    overall_scores = calculate_overall_scores(assessment_files)
 
-    # Return the collected data
-    return {
-        "question_data": question_data,
-        "assignment_name": assignment_name,
-        "file_count": len(assessment_files),
-        "overall_data": {
-            "overall_scores": overall_scores,
-            "num_students": len(overall_scores)
-        }
-    }
-
-
-def process_question_data(question_data, assessment):
+def calculate_overall_percentage(assessment):
     """
-    Process question data from an assessment.
+    Calculate the overall percentage score of a single assessment.
 
     Args:
-        question_data (dict): Dictionary to update with question data
-        assessment (dict): Assessment data to process
+        assessment (dict): Assessment data
+
+    Returns:
+        float: Overall percentage, or None if nothing was possible
     """
-    for criterion in assessment.get("criteria", []):
-        # Extract question number using regex
-        title = criterion.get("title", "")
-        match = re.search(r"Question\s+(\d+)", title)
-        if not match:
-            continue
-
-        q_num = match.group(1)
-
-        if q_num not in question_data:
-            question_data[q_num] = {
-                "scores": [],
-                "percentages": [],
-                "max_points": criterion.get("points_possible", 0),
-                "num_students": 0,
-                "title": title
-            }
-
-        # Add score
-        awarded = criterion.get("points_awarded", 0)
-        possible = criterion.get("points_possible", 0)
-        question_data[q_num]["scores"].append(awarded)
-
-        # Calculate percentage
-        if possible > 0:
-            percentage = (awarded / possible) * 100
-        else:
-            percentage = 0
-        question_data[q_num]["percentages"].append(percentage)
+    # Try to get direct overall scores if available
+    if "total_awarded" in assessment and "total_possible" in assessment:
+        if assessment["total_possible"] > 0:
+            return (assessment["total_awarded"] / assessment["total_possible"]) * 100
 
-        # Update max points if needed
-        if possible > question_data[q_num]["max_points"]:
-            question_data[q_num]["max_points"] = possible
+    # Otherwise calculate from criteria
+    student_total_awarded = 0
+    student_total_possible = 0
 
-        # Increment student count
-        question_data[q_num]["num_students"] += 1
+    for criterion in assessment.get("criteria", []):
+        student_total_awarded += criterion.get("points_awarded", 0)
+        student_total_possible += criterion.get("points_possible", 0)
+
+    if student_total_possible > 0:
+        return (student_total_awarded / student_total_possible) * 100
+    return None
 
 
 def calculate_overall_scores(assessment_files):
@@ -152,26 +435,10 @@ def calculate_overall_scores(assessment_files):
 
     for file_path in assessment_files:
         try:
-            with open(file_path, 'r') as file:
-                assessment = json.load(file)
-
-            # Try to get direct overall scores if available
-            if "total_awarded" in assessment and "total_possible" in assessment:
-                if assessment["total_possible"] > 0:
-                    percentage = (assessment["total_awarded"] / assessment["total_possible"]) * 100
-                    overall_scores.append(percentage)
-                    continue
-
-            # Otherwise calculate from criteria
-            student_total_awarded = 0
-            student_total_possible = 0
-
-            for criterion in assessment.get("criteria", []):
-                student_total_awarded += criterion.get("points_awarded", 0)
-                student_total_possible += criterion.get("points_possible", 0)
-
-            if student_total_possible > 0:
-                percentage = (student_total_awarded / student_total_possible) * 100
+            assessment = read_json_file(file_path)
+
+            percentage = calculate_overall_percentage(assessment)
+            if percentage is not None:
                 overall_scores.append(percentage)
 
         except Exception as e:
@@ -285,10 +285,50 @@ def get_assessment_data(self, validate=True):
 
 
 def update_total_points(self):
-    """Update the total points display based on selected questions and mode."""
+    """Update the total points display and the question summary."""
+    # Both displays read the same per-question sums, so walk the widgets once
+    question_scores = _question_scores(self)
+
+    # Flag unsaved changes so the auto-save picks them up, even when the
+    # question selection is invalid and no total can be shown
+    if hasattr(self, 'mark_dirty'):
+        self.mark_dirty()
+    _update_total_label(self, question_scores)
+
+    # Refreshed on every path, so callers never need to rebuild it again
+    update_question_summary(self, question_scores)
+
+
+def _question_scores(self):
+    """
+    Sum the awarded and possible points of each question.
+
+    Returns:
+        dict: {question: (awarded, possible, percentage)} for every question
+    """
+    question_scores = {}
+    for q, widgets in self.question_groups.items():
+        awarded = sum(widget.get_awarded_points() for widget in widgets)
+        possible = sum(widget.get_possible_points() for widget in widgets)
+        percentage = (awarded / possible * 100) if possible > 0 else 0
+        question_scores[q] = (awarded, possible, percentage)
+    return question_scores
+
+
+def _update_total_label(self, question_scores):
+    """
+    Update the total points display based on selected questions and mode.
+
+    Args:
+        question_scores (dict): Per-question sums from _question_scores
+
+    Returns:
+        bool: True if a total was computed, False if the label shows a
+            prompt instead (no rubric, or an invalid question selection)
+    """
     if not self.criterion_widgets:
         self.total_label.setText("Total: 0 / 0 points")
-        return
+        return False
 
     selected_questions = self.get_selected_questions()
 
@@ -302,24 +342,17 @@ def update_total_points(self):
         # In "selected" mode, we need exactly the right number
         self.total_label.setText(f"Please select exactly {questions_to_count} questions " +
                                  f"(currently {num_selected} selected)")
-        self.total_label.setStyleSheet("color: #F44336; font-weight: bold; font-size: 14pt;")  # Red
-        return
+        _set_total_state(self, "low")  # Red
+        return False
     elif grading_mode == "best_scores" and num_selected < 1:
         # In "best_scores" mode, we need at least one selection
         self.total_label.setText("Please select at least one question to grade")
-        self.total_label.setStyleSheet("color: #F44336; font-weight: bold; font-size: 14pt;")  # Red
-        return
+        _set_total_state(self, "low")  # Red
+        return False
 
-    # Calculate points for each selected question
-    question_points = {}
-
-    for q in selected_questions:
-        if q in self.question_groups:
-            q_widgets = self.question_groups[q]
-            question_awarded = sum(widget.get_awarded_points() for widget in q_widgets)
-            question_possible = sum(widget.get_possible_points() for widget in q_widgets)
-            percentage = (question_awarded / question_possible * 100) if question_possible > 0 else 0
-            question_points[q] = (question_awarded, question_possible, percentage)
+    # Points for each selected question; unchecked ones are left out
+    question_points = {q: question_scores[q] for q in selected_questions
+                       if q in question_scores}
 
     # Sort questions by score percentage (descending)
     sorted_questions = sorted(
@@ -355,22 +388,49 @@ def update_total_points(self):
     if possible_points > 0:
         percentage = (earned_points / possible_points) * 100
         if percentage >= 90:
-            self.total_label.setStyleSheet("color: #4CAF50; font-weight: bold; font-size: 14pt;")  # Green
+            _set_total_state(self, "high")  # Green
         elif percentage >= 70:
-            self.total_label.setStyleSheet("color: #FF9800; font-weight: bold; font-size: 14pt;")  # Orange
+            _set_total_state(self, "medium")  # Orange
         else:
-            self.total_label.setStyleSheet("color: #F44336; font-weight: bold; font-size: 14pt;")  # Red
-
-    # Update the question summary
-    update_question_summary(self)
+            _set_total_state(self, "low")  # Red
+    return True
 
-    # Trigger an auto-save when points are updated
-    if hasattr(self, 'auto_save_assessment'):
-        self.auto_save_assessment()
 
+def _set_total_state(self, state):
+    """
+    Color the total label through its scoreState property.
 
-def update_question_summary(self):
-    """Update the question summary display using a proper QTableWidget."""
+    The colors are rules in MAIN_WINDOW_QSS, so the label is only
+    repolished when the state changes instead of being given a new
+    stylesheet on every update.
+    """
+    if getattr(self, '_total_state', None) == state:
+        return
+    self._total_state = state
+    label = self.total_label
+    label.setProperty("scoreState", state)
+    label.style().unpolish(label)
+    label.style().polish(label)
+
+
+def update_question_summary(self, question_scores=None):
+    """
+    Update the question summary display using a proper QTableWidget.
+
+    Args:
+        question_scores (dict, optional): Per-question sums already computed
+            by _question_scores; recomputed when omitted
+    """
+    # Rebuild with painting suspended so the new table appears in one update
+    self.question_summary_card.setUpdatesEnabled(False)
+    try:
+        _rebuild_question_summary(self, question_scores)
+    finally:
+        self.question_summary_card.setUpdatesEnabled(True)
+
+
+def _rebuild_question_summary(self, question_scores=None):
+    """Replace the contents of the question summary card."""
     # Clear existing summary
     if hasattr(self, 'clear_layout'):
         self.clear_layout(self.question_summary_layout)
@@ -389,17 +449,13 @@ def update_question_summary(self):
     self.question_summary_card.setVisible(True)
 
     # Calculate scores for each question
-    question_scores = {}
-    for q, widgets in self.question_groups.items():
-        awarded = sum(widget.get_awarded_points() for widget in widgets)
-        possible = sum(widget.get_possible_points() for widget in widgets)
-        percentage = (awarded / possible * 100) if possible > 0 else 0
-        question_scores[q] = (awarded, possible, percentage)
+    if question_scores is None:
+        question_scores = _question_scores(self)
 
     # If no scores yet, show a placeholder message
     if not question_scores:
         no_data_label = QLabel("No questions have been scored yet.")
-        no_data_label.setStyleSheet("color: #757575; font-style: italic; padding: 20px;")
+        no_data_label.setObjectName("summaryPlaceholder")  # Styled by MAIN_WINDOW_QSS
         no_data_label.setAlignment(Qt.AlignCenter)
         self.question_summary_layout.addWidget(no_data_label)
         return
@@ -411,22 +467,7 @@ def update_question_summary(self):
     table.setHorizontalHeaderLabels(["Question", "Score", "Percentage", "Status"])
 
     # Set table properties
-    table.setStyleSheet("""
-        QTableWidget {
-            border: 1px solid #DDDDDD;
-            gridline-color: #DDDDDD;
-            background-color: white;
-        }
-        QTableWidget::item {
-            padding: 6px;
-        }
-        QHeaderView::section {
-            background-color: #F5F5F5;
-            padding: 6px;
-            font-weight: bold;
-            border: 1px solid #DDDDDD;
-        }
-    """)
+    table.setObjectName("questionSummaryTable")  # Styled by MAIN_WINDOW_QSS
 
     # Determine which questions are counted in the final score
     questions_to_count = self.grading_config["questions_to_count"]
@@ -505,6 +546,5 @@ def update_question_summary(self):
     # Add note about best scores if applicable
     if self.grading_config["grading_mode"] == "best_scores":
         note = QLabel(f"Note: Final score uses the {questions_to_count} highest-scoring questions.")
-        note.setStyleSheet(
-            "color: #3F51B5; font-style: italic; background-color: #E8EAF6; padding: 8px; border-radius: 4px;")
+        note.setObjectName("questionSummaryNote")  # Styled by MAIN_WINDOW_QSS
         self.question_summary_layout.addWidget(note)
\ No newline at end of file
@@ -11,12 +11,21 @@ Schema version 2.0 additions:
 import os
 import json
 import csv
+from collections import namedtuple
 from typing import Optional, Tuple, Dict
 
 from .utils import generate_criterion_id
 
+try:
+    import orjson  # Optional: faster JSON parsing when installed
+except ImportError:
+    orjson = None
+
 SCHEMA_VERSION = "2.0"
 
+# An achievement level with its checkbox label ("Good (8 pts)") precomputed
+Level = namedtuple("Level", "title points description label")
+
 
 # ---------------------------------------------------------------------------
 # Loading
@@ -56,8 +65,10 @@ def load_json_rubric(file_path: str) -> Tuple[dict, bool]:
     Returns:
         (rubric_data, is_dirty)
     """
-    with open(file_path, "r", encoding="utf-8") as fh:
-        rubric_data = json.load(fh)
+    # Read the file in one call and hand the parser the whole buffer
+    with open(file_path, "rb") as fh:
+        raw = fh.read()
+    rubric_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     if not isinstance(rubric_data, dict):
         raise ValueError("Invalid rubric format: root must be an object")
@@ -123,6 +134,22 @@ def load_csv_rubric(file_path: str) -> dict:
     return rubric
 
 
+def parse_levels(levels: list) -> Tuple[Level, ...]:
+    """
+    Convert a criterion's level dicts into Level tuples for display.
+
+    The rubric's own dicts are left as they are, since save_rubric writes
+    them back out; this only derives the values the UI needs, once.
+    """
+    parsed = []
+    for level in levels:
+        title = level.get("title")
+        points = level.get("points")
+        parsed.append(Level(title, points if points is not None else 0,
+                            level.get("description", ""), f"{title} ({points} pts)"))
+    return tuple(parsed)
+
+
 # ---------------------------------------------------------------------------
 # Saving
 # ---------------------------------------------------------------------------
@@ -1,6 +1,16 @@
 import re
 
 
+# Patterns used on every criterion title; compiled once at import time
+_NON_ALNUM_RUN_RE = re.compile(r'[^A-Z0-9]+')
+_PART_RE = re.compile(r'^\s*Part\s+([A-Z0-9]+)\b[:\s,-]*', re.IGNORECASE)
+_SECTION_RE = re.compile(r'\bSection\s+([A-Z0-9]+)\b', re.IGNORECASE)
+_BONUS_RE = re.compile(r'^\s*(?:Part\s+[A-Z0-9]+\s*)?Bonus\b', re.IGNORECASE)
+_QUESTION_ID_RE = re.compile(
+    r'\b(?:Question|Q)\s*([A-Z]+(?:\.[0-9]+)?|[0-9]+(?:\.[0-9]+)?)',
+    re.IGNORECASE
+)
+
 # ---------------------------------------------------------------------------
 # Criterion ID generation
 # ---------------------------------------------------------------------------
@@ -16,7 +26,7 @@ def normalize_title_to_id(title: str) -> str:
     # Uppercase
     s = title.upper()
     # Replace any non-alphanumeric run with a single underscore
-    s = re.sub(r'[^A-Z0-9]+', '_', s)
+    s = _NON_ALNUM_RUN_RE.sub('_', s)
     # Strip leading/trailing underscores
     s = s.strip('_')
     return s
@@ -71,20 +81,16 @@ def extract_question_number(title):
     title = title.strip()
 
     # Only treat Part as structural if it appears at the beginning
-    part_match = re.match(r'^\s*Part\s+([A-Z0-9]+)\b[:\s,-]*', title, re.IGNORECASE)
+    part_match = _PART_RE.match(title)
 
     # Section can appear after Part, or by itself
-    section_match = re.search(r'\bSection\s+([A-Z0-9]+)\b', title, re.IGNORECASE)
+    section_match = _SECTION_RE.search(title)
 
     # Bonus should also be treated as structural only near the beginning
-    bonus_match = re.match(r'^\s*(?:Part\s+[A-Z0-9]+\s*)?Bonus\b', title, re.IGNORECASE)
+    bonus_match = _BONUS_RE.match(title)
 
     # Main question identifier
-    q_match = re.search(
-        r'\b(?:Question|Q)\s*([A-Z]+(?:\.[0-9]+)?|[0-9]+(?:\.[0-9]+)?)',
-        title,
-        re.IGNORECASE
-    )
+    q_match = _QUESTION_ID_RE.search(title)
 
     parts = []
 
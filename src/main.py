@@ -9,7 +9,7 @@ import sys
 from PyQt5.QtWidgets import QApplication
 
 # Fix: import RubricGrader from the proper module
-from src.ui.main_window import RubricGrader
+from src.ui.main_window import RubricGrader, preload_icons
 from src.utils.styles import apply_material_style
 from src.utils.splash_screen import EnhancedSplashScreen
 
@@ -24,6 +24,9 @@ def main():
     splash.show()
     app.processEvents()
 
+    # Build the toolbar icons while the splash screen is showing
+    preload_icons()
+
     # Create the main window with a splash animation
     window = None
 
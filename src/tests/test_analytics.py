@@ -0,0 +1,184 @@
+"""
+test_analytics.py
+=================
+
+Tests for the analytics data processor (src/analytics/data_processor.py).
+
+Covers:
+  - Scanning a directory of assessment files into question/overall data
+  - Overall percentage fallback when totals are missing
+  - Unreadable files are skipped, not fatal
+  - Early cancellation
+  - Reusing cached per-file summaries for unchanged files
+  - Per-question running statistics
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+_QT_MOCKS = [
+    "PyQt5", "PyQt5.QtWidgets", "PyQt5.QtGui", "PyQt5.QtCore",
+    "PyQt5.QtSvg", "PyQt5.QtPrintSupport",
+    "matplotlib", "matplotlib.backends",
+    "matplotlib.backends.backend_qt5agg", "matplotlib.figure",
+    "qtawesome",
+]
+for _m in _QT_MOCKS:
+    if _m not in sys.modules:
+        sys.modules[_m] = MagicMock()
+if isinstance(sys.modules["PyQt5.QtCore"], MagicMock):
+    sys.modules["PyQt5.QtCore"].pyqtSignal = lambda *a, **kw: MagicMock()
+
+_REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, _REPO_ROOT)
+
+
+def _assessment(name, scores, possible=5, totals=True):
+    data = {
+        "student_name": name,
+        "assignment_name": "HW1",
+        "criteria": [
+            {"title": f"Question {q} - Part A", "points_awarded": s,
+             "points_possible": possible}
+            for q, s in enumerate(scores, start=1)
+        ],
+    }
+    if totals:
+        data["total_awarded"] = sum(scores)
+        data["total_possible"] = possible * len(scores)
+    return data
+
+
+class TestScanAssessmentFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.paths = []
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _write(self, name, data):
+        path = os.path.join(self.tmp, name)
+        with open(path, "w") as f:
+            if isinstance(data, str):
+                f.write(data)
+            else:
+                json.dump(data, f)
+        self.paths.append(path)
+        return path
+
+    def test_aggregates_questions_and_overall(self):
+        from src.analytics.data_processor import scan_assessment_files
+        self._write("a.json", _assessment("A", [5, 0]))
+        self._write("b.json", _assessment("B", [3, 5]))
+        result = scan_assessment_files(self.paths)
+
+        self.assertEqual(result["assignment_name"], "HW1")
+        self.assertEqual(result["file_count"], 2)
+        q1 = result["question_data"]["1"]
+        self.assertEqual(list(q1["scores"]), [5, 3])
+        self.assertEqual(q1["num_students"], 2)
+        self.assertEqual(q1["max_points"], 5)
+        self.assertAlmostEqual(q1["percentages"][1], 60.0)
+        self.assertEqual(result["overall_data"]["overall_scores"], [50.0, 80.0])
+
+    def test_overall_falls_back_to_criteria(self):
+        from src.analytics.data_processor import scan_assessment_files
+        self._write("a.json", _assessment("A", [1, 4], totals=False))
+        result = scan_assessment_files(self.paths)
+        self.assertEqual(result["overall_data"]["overall_scores"], [50.0])
+
+    def test_bad_file_is_skipped(self):
+        from src.analytics.data_processor import scan_assessment_files
+        self._write("a.json", "{not json")
+        self._write("b.json", _assessment("B", [5]))
+        result = scan_assessment_files(self.paths)
+        self.assertEqual(result["overall_data"]["num_students"], 1)
+        self.assertEqual(result["question_data"]["1"]["num_students"], 1)
+
+    def test_cancel_stops_scan(self):
+        from src.analytics.data_processor import scan_assessment_files
+        for i in range(3):
+            self._write(f"{i}.json", _assessment(str(i), [5]))
+        seen = []
+        result = scan_assessment_files(
+            self.paths,
+            progress_callback=lambda done, total: seen.append((done, total)),
+            is_canceled=lambda: len(seen) > 1,
+        )
+        self.assertEqual(result["overall_data"]["num_students"], 1)
+        self.assertEqual(seen[-1], (3, 3))
+
+    def test_cache_reuses_unchanged_files(self):
+        from unittest.mock import patch
+        from src.analytics import data_processor
+        self._write("a.json", _assessment("A", [5]))
+        b = self._write("b.json", _assessment("B", [2]))
+        cache = {}
+        first = data_processor.scan_assessment_files(self.paths, cache=cache)
+        self.assertEqual(set(cache), set(self.paths))
+
+        # Rewrite one file with a different size so only it is re-parsed
+        with open(b, "w") as f:
+            json.dump(_assessment("B", [4.5]), f)
+        with patch.object(data_processor, "load_scan_fields",
+                          wraps=data_processor.load_scan_fields) as load:
+            second = data_processor.scan_assessment_files(self.paths, cache=cache)
+        load.assert_called_once_with(b)
+        self.assertEqual(first["question_data"]["1"]["num_students"], 2)
+        self.assertEqual(list(second["question_data"]["1"]["scores"]), [5, 4.5])
+
+    def test_cache_round_trip_drops_missing_files(self):
+        from unittest.mock import patch
+        from src.analytics import data_processor
+        a = self._write("a.json", _assessment("A", [5]))
+        self._write("b.json", _assessment("B", [2]))
+        with patch.object(data_processor, "SCAN_CACHE_DIR", os.path.join(self.tmp, "cache")):
+            cache = data_processor.load_scan_cache(self.tmp)
+            self.assertEqual(cache, {})
+            data_processor.scan_assessment_files(self.paths, cache=cache)
+            data_processor.save_scan_cache(self.tmp, cache)
+
+            cache = data_processor.load_scan_cache(self.tmp)
+            result = data_processor.scan_assessment_files([a], cache=cache)
+        self.assertEqual(list(cache), [a])
+        self.assertEqual(result["overall_data"]["overall_scores"], [100.0])
+
+
+class TestQuestionStats(unittest.TestCase):
+
+    def test_running_mean_and_std(self):
+        from src.analytics.data_processor import QuestionStats
+        stats = QuestionStats()
+        for score in (2, 4, 4, 4, 5, 5, 7, 9):
+            stats.add(score, 10)
+        self.assertEqual(stats.n, 8)
+        self.assertAlmostEqual(stats.mean, 5.0)
+        self.assertAlmostEqual(stats.std, 2.0)
+
+    def test_to_dict_uses_max_points(self):
+        from src.analytics.data_processor import QuestionStats
+        stats = QuestionStats(title="Question 1")
+        stats.add(2, 4)
+        stats.add(5, 5)
+        data = stats.to_dict()
+        self.assertEqual(data["max_points"], 5)
+        self.assertEqual(data["num_students"], 2)
+        self.assertEqual(list(data["percentages"]), [40.0, 100.0])
+
+    def test_empty_stats(self):
+        from src.analytics.data_processor import QuestionStats
+        stats = QuestionStats()
+        self.assertEqual(stats.mean, 0.0)
+        self.assertEqual(stats.std, 0.0)
+        self.assertEqual(len(stats.to_dict()["scores"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
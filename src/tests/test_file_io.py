@@ -0,0 +1,150 @@
+"""
+test_file_io.py
+===============
+
+Tests for the Qt-free helpers in src/utils/file_io.py.
+
+Covers:
+  - Filename sanitization
+  - Compact vs. indented JSON encoding
+  - Atomic writes through a temporary file, cleaned up on failure
+  - Pruning auto-save files by prefix
+  - Tracking recent auto-saves without rescanning the directory
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+_QT_MOCKS = [
+    "PyQt5", "PyQt5.QtWidgets", "PyQt5.QtGui", "PyQt5.QtCore",
+    "PyQt5.QtSvg", "PyQt5.QtPrintSupport",
+    "matplotlib", "matplotlib.backends",
+    "matplotlib.backends.backend_qt5agg", "matplotlib.figure",
+    "qtawesome",
+]
+for _m in _QT_MOCKS:
+    if _m not in sys.modules:
+        sys.modules[_m] = MagicMock()
+if isinstance(sys.modules["PyQt5.QtCore"], MagicMock):
+    sys.modules["PyQt5.QtCore"].pyqtSignal = lambda *a, **kw: MagicMock()
+
+_REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, _REPO_ROOT)
+
+
+class TestSanitizeFilename(unittest.TestCase):
+
+    def test_matches_isalnum_rule(self):
+        from src.utils.file_io import sanitize_filename
+        name = "Jane Doe/x_é-1"
+        expected = ''.join(c if c.isalnum() else '_' for c in name)
+        self.assertEqual(sanitize_filename(name), expected)
+        self.assertEqual(sanitize_filename(name), "Jane_Doe_x_é_1")
+
+
+class TestDumpJsonBytes(unittest.TestCase):
+
+    def test_compact_round_trips_without_whitespace(self):
+        from src.utils.file_io import dump_json_bytes
+        data = {"student_name": "Zoë", "criteria": [{"points": 1.5}]}
+        raw = dump_json_bytes(data, compact=True)
+        self.assertNotIn(b"\n", raw)
+        self.assertNotIn(b": ", raw)
+        self.assertEqual(json.loads(raw), data)
+
+    def test_default_is_indented(self):
+        from src.utils.file_io import dump_json_bytes
+        raw = dump_json_bytes({"a": [1]})
+        self.assertIn(b"\n  ", raw)
+
+
+class TestWriteFileAtomic(unittest.TestCase):
+
+    def test_replaces_file_and_removes_temp(self):
+        from src.utils.file_io import write_file_atomic
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        path = os.path.join(tmp, "a.json")
+        with open(path, "wb") as f:
+            f.write(b"old")
+        write_file_atomic(path, b"new", fsync=True)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"new")
+        self.assertEqual(os.listdir(tmp), ["a.json"])
+
+    def test_failed_replace_keeps_file_and_removes_temp(self):
+        from src.utils.file_io import write_file_atomic
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        path = os.path.join(tmp, "a.json")
+        with open(path, "wb") as f:
+            f.write(b"old")
+        with patch("src.utils.file_io.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_file_atomic(path, b"new")
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"old")
+        self.assertEqual(os.listdir(tmp), ["a.json"])
+
+
+class TestAutoSaveFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _touch(self, name, mtime):
+        path = os.path.join(self.tmp, name)
+        open(path, "w").close()
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_prune_keeps_newest_for_prefix(self):
+        from src.utils.file_io import prune_auto_save_files
+        for i in range(6):
+            self._touch(f"autosave_a_{i}.json", i)
+        self._touch("autosave_b_0.json", 0)
+        prune_auto_save_files(self.tmp, "autosave_a_", keep=2)
+        self.assertEqual(sorted(os.listdir(self.tmp)),
+                         ["autosave_a_4.json", "autosave_a_5.json", "autosave_b_0.json"])
+
+    def test_track_returns_paths_beyond_keep(self):
+        from src.utils.file_io import track_auto_save
+        old = [self._touch(f"autosave_a_{i}.json", i) for i in range(3)]
+        window = SimpleNamespace()
+        new = os.path.join(self.tmp, "autosave_a_9.json")
+        self.assertEqual(track_auto_save(window, "autosave_a_", new, keep=2), old[:2])
+        self.assertEqual(list(window._autosave_paths), [old[2], new])
+
+    def test_track_does_not_rescan_for_same_prefix(self):
+        from src.utils import file_io
+        window = SimpleNamespace()
+        first = os.path.join(self.tmp, "autosave_a_1.json")
+        second = os.path.join(self.tmp, "autosave_a_2.json")
+        file_io.track_auto_save(window, "autosave_a_", first, keep=1)
+        with patch.object(file_io, "list_auto_save_files") as scan:
+            stale = file_io.track_auto_save(window, "autosave_a_", second, keep=1)
+        scan.assert_not_called()
+        self.assertEqual(stale, [first])
+
+    def test_forget_forces_rescan(self):
+        from src.utils import file_io
+        window = SimpleNamespace()
+        path = os.path.join(self.tmp, "autosave_a_1.json")
+        file_io.track_auto_save(window, "autosave_a_", path)
+        file_io.forget_auto_saves(window)
+        with patch.object(file_io, "list_auto_save_files", return_value=[]) as scan:
+            file_io.track_auto_save(window, "autosave_a_", path)
+        scan.assert_called_once_with(self.tmp, "autosave_a_")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,15 +12,22 @@ so CriterionWidget itself becomes a MagicMock — its real methods are never
 defined.  Attempting to import or instantiate it in a headless environment
 therefore always fails.
 
-Fix: define the five business-logic methods (get_data, set_data, reset,
-get_awarded_points, get_possible_points) as standalone functions that accept
-a plain SimpleNamespace in place of `self`.  This is equivalent to calling the
-real methods because they only access four instance attributes:
+Fix: define the business-logic methods (get_data, set_data, reset, the
+level-selection handlers, get_awarded_points, get_possible_points) as
+standalone functions that accept a plain SimpleNamespace in place of `self`.
+This is equivalent to calling the real methods because they only access
+these instance attributes:
 
     self.criterion_data      dict
     self.points_spinbox      QDoubleSpinBox  (mocked)
     self.comments_edit       MarkdownMathEditor  (mocked)
     self.level_checkboxes    list of (QCheckBox, int)  (mocked)
+    self._populate_levels    builds pending level rows  (mocked)
+    self._checked_level      currently checked level checkbox
+    self._level_points       {checkbox: points}
+    self._level_titles       {checkbox: level name}
+    self._level_by_title     {level name: checkbox}
+    self._cached_data        cached get_data() result or None
 
 The function bodies are copied verbatim from criterion.py so any change to
 the real code will require an equivalent change here.
@@ -61,18 +68,16 @@ sys.path.insert(0, _REPO_ROOT)
 # ---------------------------------------------------------------------------
 
 def get_data(self):
-    selected_level = None
-    for checkbox, _ in getattr(self, "level_checkboxes", []):
-        if checkbox.isChecked():
-            selected_level = checkbox.text().split(" (")[0]
-    return {
-        "id":              self.criterion_data.get("id", ""),
-        "title":           self.criterion_data.get("title", ""),
-        "points_awarded":  self.points_spinbox.value(),
-        "points_possible": self.criterion_data.get("points", 0),
-        "selected_level":  selected_level,
-        "comments":        self.comments_edit.get_text(),
-    }
+    if self._cached_data is None:
+        self._cached_data = {
+            "id":              self.criterion_data.get("id", ""),
+            "title":           self.criterion_data.get("title", ""),
+            "points_awarded":  self.points_spinbox.value(),
+            "points_possible": self.criterion_data.get("points", 0),
+            "selected_level":  self._level_titles.get(self._checked_level),
+            "comments":        self.comments_edit.get_text(),
+        }
+    return dict(self._cached_data)
 
 
 def set_data(self, criterion_data):
@@ -80,10 +85,10 @@ def set_data(self, criterion_data):
     self.comments_edit.set_text(criterion_data.get("comments", ""))
     selected_level = criterion_data.get("selected_level", "")
     if selected_level and hasattr(self, "level_checkboxes"):
-        for checkbox, _ in self.level_checkboxes:
-            if checkbox.text().split(" (")[0] == selected_level:
-                checkbox.setChecked(True)
-                break
+        self._populate_levels()
+        checkbox = self._level_by_title.get(selected_level)
+        if checkbox is not None:
+            checkbox.setChecked(True)
 
 
 def reset(self):
@@ -93,6 +98,24 @@ def reset(self):
         checkbox.setChecked(False)
 
 
+def _on_level_toggled(self, checkbox, checked):
+    self._cached_data = None
+    if checked:
+        previous, self._checked_level = self._checked_level, checkbox
+        if previous is not None and previous is not checkbox:
+            previous.setChecked(False)
+    elif checkbox is self._checked_level:
+        self._checked_level = None
+
+
+def update_points_from_level(self, checkbox):
+    if checkbox.isChecked():
+        previous = self.points_spinbox.value()
+        self.points_spinbox.setValue(self._level_points[checkbox])
+        if self.points_spinbox.value() == previous:
+            self.points_changed.emit()
+
+
 def get_awarded_points(self):
     return self.points_spinbox.value()
 
@@ -130,11 +153,19 @@ def _make_widget(points_value=8.0, comment="Test comment",
         (_cb("Satisfactory",  6, levels_checked[2]),  6),
     ]
 
+    titles  = {cb: cb.text.return_value.split(" (")[0] for cb, _ in level_checkboxes}
+    checked = [cb for cb, _ in level_checkboxes if cb.isChecked.return_value]
+
     return SimpleNamespace(
         criterion_data   = criterion_data,
         points_spinbox   = spinbox,
         comments_edit    = editor,
         level_checkboxes = level_checkboxes,
+        _populate_levels = MagicMock(),
+        _checked_level   = checked[-1] if checked else None,
+        _level_titles    = titles,
+        _level_by_title  = {t: cb for cb, t in titles.items()},
+        _cached_data     = None,
     )
 
 
@@ -156,6 +187,25 @@ class TestCriterionWidget(unittest.TestCase):
         self.assertEqual(data["selected_level"],  "Good")
         self.assertEqual(data["comments"],        "Test comment")
 
+    def test_get_data_is_cached_until_invalidated(self):
+        w = _make_widget(comment="First")
+        get_data(w)
+        w.comments_edit.get_text.return_value = "Second"
+        self.assertEqual(get_data(w)["comments"], "First")
+        w._cached_data = None  # what _invalidate_data does
+        self.assertEqual(get_data(w)["comments"], "Second")
+
+    def test_get_data_returns_a_copy(self):
+        w = _make_widget()
+        get_data(w)["selected"] = True
+        self.assertNotIn("selected", get_data(w))
+
+    def test_level_toggle_invalidates_cached_data(self):
+        w = _make_widget()
+        get_data(w)
+        _on_level_toggled(w, w.level_checkboxes[0][0], True)
+        self.assertIsNone(w._cached_data)
+
     def test_get_data_no_level_selected(self):
         w    = _make_widget(levels_checked=(False, False, False))
         data = get_data(w)
@@ -177,6 +227,16 @@ class TestCriterionWidget(unittest.TestCase):
         set_data(w, {"points_awarded": 6, "comments": "", "selected_level": "Satisfactory"})
         w.level_checkboxes[2][0].setChecked.assert_called_with(True)
 
+    def test_set_data_builds_pending_levels(self):
+        w = _make_widget()
+        set_data(w, {"points_awarded": 6, "comments": "", "selected_level": "Good"})
+        w._populate_levels.assert_called_once()
+
+    def test_set_data_without_level_keeps_levels_pending(self):
+        w = _make_widget()
+        set_data(w, {"points_awarded": 6, "comments": "", "selected_level": ""})
+        w._populate_levels.assert_not_called()
+
     # reset
     def test_reset_zeros_points(self):
         w = _make_widget()
@@ -203,6 +263,42 @@ class TestCriterionWidget(unittest.TestCase):
         w = _make_widget()
         self.assertEqual(get_possible_points(w), 10)
 
+    # level selection
+    def test_checking_level_unchecks_previous(self):
+        w = SimpleNamespace(_checked_level=None, _cached_data=None)
+        first, second = MagicMock(), MagicMock()
+        _on_level_toggled(w, first, True)
+        _on_level_toggled(w, second, True)
+        first.setChecked.assert_called_once_with(False)
+        self.assertIs(w._checked_level, second)
+
+    def test_unchecking_current_level_clears_selection(self):
+        w = SimpleNamespace(_checked_level=None, _cached_data=None)
+        box = MagicMock()
+        _on_level_toggled(w, box, True)
+        _on_level_toggled(w, box, False)
+        self.assertIsNone(w._checked_level)
+
+    def test_clicked_level_sets_its_points(self):
+        box = MagicMock()
+        box.isChecked.return_value = True
+        w = SimpleNamespace(points_spinbox=MagicMock(), points_changed=MagicMock(),
+                            _level_points={box: 7.5})
+        update_points_from_level(w, box)
+        w.points_spinbox.setValue.assert_called_once_with(7.5)
+        w.points_changed.emit.assert_called_once()
+
+    def test_new_level_points_are_reported_once_by_the_spinbox(self):
+        box = MagicMock()
+        box.isChecked.return_value = True
+        spinbox = MagicMock()
+        spinbox.value.side_effect = [2.0, 7.5]
+        w = SimpleNamespace(points_spinbox=spinbox, points_changed=MagicMock(),
+                            _level_points={box: 7.5})
+        update_points_from_level(w, box)
+        spinbox.setValue.assert_called_once_with(7.5)
+        w.points_changed.emit.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # parse_rubric_file via rubric_parser shim
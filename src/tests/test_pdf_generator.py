@@ -0,0 +1,101 @@
+"""
+test_pdf_generator.py
+=====================
+
+Tests for the Qt-free helpers in src/utils/pdf_generator.py.
+
+Covers:
+  - Letter grade cutoffs, including the exact boundaries and fractions
+  - Cleaning LaTeX and HTML out of text for ReportLab paragraphs
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+_QT_MOCKS = [
+    "PyQt5", "PyQt5.QtWidgets", "PyQt5.QtGui", "PyQt5.QtCore",
+    "PyQt5.QtSvg", "PyQt5.QtPrintSupport",
+    "matplotlib", "matplotlib.backends",
+    "matplotlib.backends.backend_qt5agg", "matplotlib.figure",
+    "qtawesome",
+]
+for _m in _QT_MOCKS:
+    if _m not in sys.modules:
+        sys.modules[_m] = MagicMock()
+if isinstance(sys.modules["PyQt5.QtCore"], MagicMock):
+    sys.modules["PyQt5.QtCore"].pyqtSignal = lambda *a, **kw: MagicMock()
+
+_REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, _REPO_ROOT)
+
+
+def _chained_letter_grade(percentage):
+    """The original if/elif implementation, kept as the reference."""
+    if percentage >= 90:
+        return "A"
+    elif percentage >= 80:
+        return "B"
+    elif percentage >= 70:
+        return "C"
+    elif percentage >= 60:
+        return "D"
+    else:
+        return "F"
+
+
+class TestGetLetterGrade(unittest.TestCase):
+
+    def test_boundaries_are_inclusive(self):
+        from src.utils.pdf_generator import get_letter_grade
+        cases = {
+            0: "F", 59.99: "F", 60: "D", 69.9: "D", 70: "C",
+            79.99: "C", 80: "B", 89.999: "B", 90: "A", 100: "A",
+        }
+        for percentage, grade in cases.items():
+            with self.subTest(percentage=percentage):
+                self.assertEqual(get_letter_grade(percentage), grade)
+
+    def test_out_of_range_scores(self):
+        from src.utils.pdf_generator import get_letter_grade
+        self.assertEqual(get_letter_grade(-5), "F")
+        self.assertEqual(get_letter_grade(112.5), "A")
+
+    def test_matches_if_chain(self):
+        from src.utils.pdf_generator import get_letter_grade
+        for tenths in range(-10, 1101):
+            percentage = tenths / 10
+            with self.subTest(percentage=percentage):
+                self.assertEqual(get_letter_grade(percentage),
+                                 _chained_letter_grade(percentage))
+
+
+class TestCleanTextForPdf(unittest.TestCase):
+
+    def test_latex_becomes_unicode_and_html_is_escaped(self):
+        from src.utils.pdf_generator import clean_text_for_pdf
+        self.assertEqual(clean_text_for_pdf("$\\alpha \\leq 3$ <b> & \\foo"),
+                         "α ≤ 3 &lt;b&gt; &amp; foo")
+
+    def test_plain_text_and_empty_values(self):
+        from src.utils.pdf_generator import clean_text_for_pdf
+        self.assertEqual(clean_text_for_pdf("Costs $5"), "Costs 5")
+        self.assertEqual(clean_text_for_pdf(""), "")
+        self.assertEqual(clean_text_for_pdf(None), "")
+
+    def test_longer_commands_win_over_their_prefixes(self):
+        from src.utils.pdf_generator import clean_text_for_pdf
+        self.assertEqual(clean_text_for_pdf("\\infty \\int \\in \\subseteq \\subset"),
+                         "∞ ∫ ∈ ⊆ ⊂")
+
+    def test_no_command_is_shadowed_by_an_earlier_prefix(self):
+        from src.utils.pdf_generator import _LATEX_REPLACEMENTS
+        commands = [latex for latex, _ in _LATEX_REPLACEMENTS]
+        for i, later in enumerate(commands):
+            for earlier in commands[:i]:
+                self.assertFalse(later.startswith(earlier), f"{earlier} shadows {later}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -228,6 +228,32 @@ class TestRubricLoading(unittest.TestCase):
             self.assertEqual(c["abet_outcomes"],    ["SO1", "SO6"])
 
 
+# ---------------------------------------------------------------------------
+# parse_levels
+# ---------------------------------------------------------------------------
+
+class TestParseLevels(unittest.TestCase):
+
+    def test_label_and_fields(self):
+        from src.core.rubric import parse_levels
+        levels = parse_levels([{"title": "Good", "points": 7.5, "description": "Mostly"}])
+        self.assertEqual(levels[0].label, "Good (7.5 pts)")
+        self.assertEqual(levels[0].points, 7.5)
+        self.assertEqual(levels[0].description, "Mostly")
+
+    def test_missing_points_and_description(self):
+        from src.core.rubric import parse_levels
+        level = parse_levels([{"title": "Poor"}])[0]
+        self.assertEqual(level.points, 0)
+        self.assertEqual(level.description, "")
+
+    def test_source_dicts_untouched(self):
+        from src.core.rubric import parse_levels
+        raw = [{"title": "A", "points": 1}]
+        parse_levels(raw)
+        self.assertEqual(raw, [{"title": "A", "points": 1}])
+
+
 # ---------------------------------------------------------------------------
 # rubric_parser shim
 # ---------------------------------------------------------------------------
@@ -4,8 +4,15 @@ Dialog modules for the Rubric Grading Tool.
 This package contains all dialog windows used in the application.
 """
 
-from .analytics import AnalyticsDialog
 from .config import GradingConfigDialog
 from .abet_dialogs import ABETMappingDialog, ABETReportDialog
 
+
+def __getattr__(name):
+    # AnalyticsDialog pulls in matplotlib; only import it when first used
+    if name == 'AnalyticsDialog':
+        from .analytics import AnalyticsDialog
+        return AnalyticsDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = ['AnalyticsDialog', 'GradingConfigDialog', 'ABETMappingDialog', 'ABETReportDialog']
\ No newline at end of file
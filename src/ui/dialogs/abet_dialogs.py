@@ -779,10 +779,10 @@ class ABETReportDialog(QDialog):
         so_ids  = list(profile.program_outcomes.keys()) if profile else None
 
         from src.tools.abet_validation import validate_all, issues_summary
-        import glob
+        from src.utils.file_io import list_json_files
 
         assessments = []
-        for path in glob.glob(os.path.join(self.selected_dir, "*.json")):
+        for path in list_json_files(self.selected_dir):
             try:
                 with open(path) as fh:
                     data = json.load(fh)
@@ -125,6 +125,13 @@ class AnalyticsDialog(QDialog):
         self.update_chart()
         self.update_overall_chart()
 
+    @staticmethod
+    def plot_histogram(axes, values, bins, color, density=False):
+        """Bin scores with NumPy and draw them as bars on the given axes."""
+        counts, edges = np.histogram(values, bins=bins, range=(0, 100), density=density)
+        axes.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                 alpha=0.7, color=color, edgecolor='black')
+
     def update_chart(self):
         """Update the question performance chart."""
         if not self.student_data or "question_data" not in self.student_data:
@@ -142,16 +149,14 @@ class AnalyticsDialog(QDialog):
         q_data = self.student_data["question_data"][q_key]
 
         # Get scores
-        scores = q_data["scores"]
+        scores = np.asarray(q_data["scores"], dtype=float)
         max_points = q_data["max_points"]
 
-        # Calculate percentages
-        percentages = []
-        for score in scores:
-            if max_points > 0:
-                percentages.append((score / max_points) * 100)
-            else:
-                percentages.append(0)
+        # Calculate percentages in one vectorized step
+        if max_points > 0:
+            percentages = scores * (100.0 / max_points)
+        else:
+            percentages = np.zeros_like(scores)
 
         # Get bin count
         bins = self.bin_slider.value()
@@ -159,16 +164,12 @@ class AnalyticsDialog(QDialog):
         # Plot histogram
         if self.normalize_cb.isChecked():
             # Plot normalized (percentage) histogram
-            n, bins, patches = self.canvas.axes.hist(percentages, bins=bins, alpha=0.7,
-                                                     range=(0, 100), density=True,
-                                                     color='#3F51B5', edgecolor='black')
+            self.plot_histogram(self.canvas.axes, percentages, bins, '#3F51B5', density=True)
             self.canvas.axes.set_xlabel('Score (%)')
             self.canvas.axes.set_ylabel('Frequency Density')
         else:
             # Plot count histogram
-            n, bins, patches = self.canvas.axes.hist(percentages, bins=bins, alpha=0.7,
-                                                     range=(0, 100), density=False,
-                                                     color='#3F51B5', edgecolor='black')
+            self.plot_histogram(self.canvas.axes, percentages, bins, '#3F51B5')
             self.canvas.axes.set_xlabel('Score (%)')
             self.canvas.axes.set_ylabel('Number of Students')
 
@@ -180,9 +181,9 @@ class AnalyticsDialog(QDialog):
         self.canvas.axes.set_title(question_title)
 
         # Calculate statistics
-        mean = np.mean(percentages) if percentages else 0
-        median = np.median(percentages) if percentages else 0
-        std_dev = np.std(percentages) if percentages else 0
+        mean = np.mean(percentages) if percentages.size else 0
+        median = np.median(percentages) if percentages.size else 0
+        std_dev = np.std(percentages) if percentages.size else 0
 
         # Update stats label
         stats_text = f"Statistics: Mean: {mean:.1f}% | Median: {median:.1f}% | Standard Deviation: {std_dev:.1f}% | Sample Size: {len(percentages)}"
@@ -230,9 +231,7 @@ class AnalyticsDialog(QDialog):
 
         # Plot histogram
         if overall_scores:
-            n, bins, patches = self.overall_canvas.axes.hist(overall_scores, bins=10, alpha=0.7,
-                                                             range=(0, 100), density=False,
-                                                             color='#4CAF50', edgecolor='black')
+            self.plot_histogram(self.overall_canvas.axes, overall_scores, 10, '#4CAF50')
             self.overall_canvas.axes.set_xlabel('Overall Score (%)')
             self.overall_canvas.axes.set_ylabel('Number of Students')
             self.overall_canvas.axes.set_title('Overall Score Distribution')
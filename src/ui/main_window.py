@@ -4,19 +4,17 @@ Main window implementation for the Rubric Grading Tool.
 
 import os
 import time
-import json
+import hashlib
 import tempfile
-from src.ui.dialogs.abet_dialogs import (
-    ABETMappingDialog, ABETReportDialog, SemesterABETReportDialog,
-)
+from functools import lru_cache
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QFileDialog, QScrollArea,
+    QLabel, QPushButton, QScrollArea,
     QLineEdit, QMessageBox, QGroupBox,
     QFrame, QSplitter, QDialog
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QThreadPool
 import qtawesome as qta
 
 # Import from core modules
@@ -32,11 +30,39 @@ from src.ui.widgets.card import CardWidget
 
 # Import from utils
 from src.utils.layout import setup_question_selection
-from src.utils.styles import COLORS
-from src.utils.pdf import export_to_pdf, batch_export_assessments
+from src.utils.file_io import (
+    JSON_FILE_FILTER, RUBRIC_FILE_FILTER, AutoSaveTask, dump_json_bytes,
+    forget_auto_saves, get_open_file_name, get_save_file_name,
+    prune_auto_save_files, read_json_file, sanitize_filename,
+    track_auto_save, write_file_atomic
+)
+from src.utils.styles import MAIN_WINDOW_QSS, install_stylesheet
+
 
-# Import from analytics
-from src.analytics.data_processor import collect_assessments
+@lru_cache(maxsize=None)
+def _cached_icon(name):
+    """Return a shared QIcon for a qtawesome icon name."""
+    return qta.icon(name)
+
+
+# Every icon used by the main window, so they can be built ahead of time
+_ICON_NAMES = (
+    'fa5s.folder-open', 'fa5s.chart-bar', 'fa5s.clipboard-check',
+    'fa5s.file-contract', 'fa5s.calendar-alt', 'fa5s.cog',
+    'fa5s.file-export', 'fa5s.eraser', 'fa5s.save', 'fa5s.file-upload',
+)
+
+
+def preload_icons():
+    """
+    Build all main window icons (and load the icon fonts) up front.
+
+    qtawesome loads fonts through QFontDatabase, so this must run on the GUI
+    thread; call it while the splash screen is idle, before the window is
+    created.
+    """
+    for name in _ICON_NAMES:
+        _cached_icon(name)
 
 
 class RubricGrader(QMainWindow):
@@ -47,18 +73,34 @@ class RubricGrader(QMainWindow):
         super().__init__()
         self.rubric_data = None
         self.criterion_widgets = []
+        self._spare_criterion_widgets = []  # Hidden widgets kept for reuse by the next rubric
         self.question_groups = {}  # Dictionary to group widgets by main question
+        self._parsed_criteria = None  # (criteria list, [(criterion, main question)]) from _parse_criteria
         self.student_name = ""
         self.assignment_name = ""
+        # Cached copies of the name fields, kept in sync via textChanged
+        self._student_name_cache = ""
+        self._assignment_name_cache = ""
+        self._sanitized_student = "unnamed_student"
         self.rubric_file_path = None  # Store the path to the loaded rubric
         self.current_assessment_path = None  # Path to the current assessment file
+        self._file_dialog = None  # Reused by the open/save prompts, built on first use
+        self._last_export_dir = os.path.expanduser("~")  # Starting directory for export dialogs
+        self._config_info_dirty = False  # Config text changed while the card was hidden
+        self._last_cfg_key = None  # Inputs behind the currently displayed config text
+        self._total_points_pending = False  # update_total_points already queued
         self.auto_save_timer = None  # Timer for auto-saving
-        self.auto_save_interval = 3 * 60 * 1000  # Auto-save every 3 minutes (in milliseconds)
+        self.auto_save_interval = 3 * 60 * 1000  # Auto-save 3 minutes after the first unsaved change (in milliseconds)
+        self._dirty = False  # Unsaved changes since the last auto-save
+        self._auto_save_in_flight = False  # A background auto-save write is running
+        self._auto_save_pending = False  # Another auto-save was requested meanwhile
+        self._last_autosave_digest = None  # Hash of the last auto-saved payload
+        self._autosave_paths = None  # Recent auto-saves for _autosave_prefix, oldest first
+        self._autosave_prefix = None
         self.auto_save_dir = os.path.join(tempfile.gettempdir(), "rubric_grader_autosave")
 
         # Create auto-save directory if it doesn't exist
-        if not os.path.exists(self.auto_save_dir):
-            os.makedirs(self.auto_save_dir)
+        os.makedirs(self.auto_save_dir, exist_ok=True)
 
         # Default grading configuration
         self.grading_config = {
@@ -74,6 +116,7 @@ class RubricGrader(QMainWindow):
         self.setMinimumSize(800, 600)  # Smaller minimum size
         self.resize(1000, 700)  # Default size
 
+        install_stylesheet(MAIN_WINDOW_QSS)
         self.init_ui()
         self.setup_auto_save()
 
@@ -97,7 +140,7 @@ class RubricGrader(QMainWindow):
         divider = QFrame()
         divider.setFrameShape(QFrame.HLine)
         divider.setFrameShadow(QFrame.Sunken)
-        divider.setStyleSheet(f"background-color: {COLORS['divider'].name()};")
+        divider.setObjectName("mainDivider")
         main_layout.addWidget(divider)
 
         # Create a toolbar container
@@ -106,79 +149,76 @@ class RubricGrader(QMainWindow):
         toolbar_layout.setContentsMargins(0, 8, 0, 8)
 
         # Rubric controls group
-        rubric_group = QWidget()
-        rubric_layout = QHBoxLayout(rubric_group)
+        rubric_layout = QHBoxLayout()
         rubric_layout.setContentsMargins(0, 0, 0, 0)
         rubric_layout.setSpacing(8)
 
         # Load rubric button
         self.load_btn = QPushButton("Load Rubric")
-        self.load_btn.setIcon(qta.icon('fa5s.folder-open'))
+        self.load_btn.setIcon(_cached_icon('fa5s.folder-open'))
         self.load_btn.clicked.connect(self.load_rubric)
         rubric_layout.addWidget(self.load_btn)
 
-        toolbar_layout.addWidget(rubric_group)
+        toolbar_layout.addLayout(rubric_layout)
 
         # Add spacer
         toolbar_layout.addStretch()
 
         # Student and assignment info
-        info_widget = QWidget()
-        info_layout = QHBoxLayout(info_widget)
+        info_layout = QHBoxLayout()
         info_layout.setContentsMargins(0, 0, 0, 0)
         info_layout.setSpacing(16)
 
         # Student name field with floating label
-        student_container = QWidget()
-        student_layout = QVBoxLayout(student_container)
+        student_layout = QVBoxLayout()
         student_layout.setContentsMargins(0, 0, 0, 0)
         student_layout.setSpacing(4)
 
         student_label = QLabel("Student")
-        student_label.setStyleSheet("color: #757575; font-size: 12px;")
+        student_label.setObjectName("fieldLabel")
         student_layout.addWidget(student_label)
 
         self.student_name_edit = QLineEdit()
         self.student_name_edit.setPlaceholderText("Enter student name")
+        self.student_name_edit.textChanged.connect(self._on_student_name_changed)
         student_layout.addWidget(self.student_name_edit)
 
-        info_layout.addWidget(student_container)
+        info_layout.addLayout(student_layout)
 
         # Assignment name field with floating label
-        assignment_container = QWidget()
-        assignment_layout = QVBoxLayout(assignment_container)
+        assignment_layout = QVBoxLayout()
         assignment_layout.setContentsMargins(0, 0, 0, 0)
         assignment_layout.setSpacing(4)
 
         assignment_label = QLabel("Assignment")
-        assignment_label.setStyleSheet("color: #757575; font-size: 12px;")
+        assignment_label.setObjectName("fieldLabel")
         assignment_layout.addWidget(assignment_label)
 
         self.assignment_name_edit = QLineEdit()
         self.assignment_name_edit.setPlaceholderText("Enter assignment name")
+        self.assignment_name_edit.textChanged.connect(self._on_assignment_name_changed)
         assignment_layout.addWidget(self.assignment_name_edit)
 
-        info_layout.addWidget(assignment_container)
+        info_layout.addLayout(assignment_layout)
 
-        toolbar_layout.addWidget(info_widget)
+        toolbar_layout.addLayout(info_layout)
 
         # Add spacer
         toolbar_layout.addStretch()
 
         # Action buttons
-        actions_widget = QWidget()
-        actions_layout = QHBoxLayout(actions_widget)
+        actions_layout = QHBoxLayout()
         actions_layout.setContentsMargins(0, 0, 0, 0)
         actions_layout.setSpacing(8)
 
         self.analytics_btn = QPushButton("Analytics")
-        self.analytics_btn.setIcon(qta.icon('fa5s.chart-bar'))
+        self.analytics_btn.setIcon(_cached_icon('fa5s.chart-bar'))
         self.analytics_btn.clicked.connect(self.show_analytics)
         actions_layout.addWidget(self.analytics_btn)
 
         # ABET mapping button
         self.abet_mapping_btn = QPushButton("ABET Mapping")
-        self.abet_mapping_btn.setIcon(qta.icon('fa5s.clipboard-check'))
+        self.abet_mapping_btn.setIcon(_cached_icon('fa5s.clipboard-check'))
         self.abet_mapping_btn.clicked.connect(self.show_abet_mapping)
         self.abet_mapping_btn.setEnabled(False)
         self.abet_mapping_btn.setToolTip("Map rubric criteria to ABET student outcomes")
@@ -186,33 +226,33 @@ class RubricGrader(QMainWindow):
 
         # ABET report button
         self.abet_report_btn = QPushButton("ABET Report")
-        self.abet_report_btn.setIcon(qta.icon('fa5s.file-contract'))
+        self.abet_report_btn.setIcon(_cached_icon('fa5s.file-contract'))
         self.abet_report_btn.clicked.connect(self.show_abet_report)
         self.abet_report_btn.setToolTip("Generate ABET assessment report for one assignment")
         actions_layout.addWidget(self.abet_report_btn)
 
         # Semester ABET report button
         self.semester_abet_btn = QPushButton("Semester Report")
-        self.semester_abet_btn.setIcon(qta.icon('fa5s.calendar-alt'))
+        self.semester_abet_btn.setIcon(_cached_icon('fa5s.calendar-alt'))
         self.semester_abet_btn.clicked.connect(self.show_semester_abet_report)
         self.semester_abet_btn.setToolTip("Generate semester-level ABET aggregation report")
         actions_layout.addWidget(self.semester_abet_btn)
 
         # Grading configuration button
         self.config_btn = QPushButton("Grading Config")
-        self.config_btn.setIcon(qta.icon('fa5s.cog'))
+        self.config_btn.setIcon(_cached_icon('fa5s.cog'))
         self.config_btn.clicked.connect(self.show_grading_config)
         self.config_btn.setEnabled(False)
         actions_layout.addWidget(self.config_btn)
 
         # Export button
         self.export_btn = QPushButton("Export to PDF")
-        self.export_btn.setIcon(qta.icon('fa5s.file-export'))
+        self.export_btn.setIcon(_cached_icon('fa5s.file-export'))
         self.export_btn.clicked.connect(self.export_to_pdf)
         self.export_btn.setEnabled(False)
         actions_layout.addWidget(self.export_btn)
 
-        toolbar_layout.addWidget(actions_widget)
+        toolbar_layout.addLayout(actions_layout)
 
         main_layout.addWidget(toolbar_container)
 
@@ -225,20 +265,16 @@ class RubricGrader(QMainWindow):
         self.config_card = CardWidget("Grading Configuration")
         config_layout = self.config_card.get_content_layout()
         self.config_info = QLabel()
+        self.config_info.setTextFormat(Qt.PlainText)
         config_layout.addWidget(self.config_info)
         main_layout.addWidget(self.config_card)
         self.update_config_info()
 
         # Questions selection group
         self.question_selection_group = QGroupBox("Questions Attempted by Student")
-        self.question_selection_group.setStyleSheet("""
-            QGroupBox {
-                background-color: white;
-                border-radius: 4px;
-                margin-top: 16px;
-            }
-        """)
+        self.question_selection_group.setObjectName("questionSelectionGroup")
         self.question_selection_layout = QHBoxLayout()
+        self._question_selection_panel = None  # Replaced wholesale by setup_question_selection
         self.question_selection_group.setLayout(self.question_selection_layout)
         self.question_selection_group.setVisible(False)
         main_layout.addWidget(self.question_selection_group)
@@ -246,17 +282,7 @@ class RubricGrader(QMainWindow):
         # Scroll area for criteria with card-like appearance
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            QWidget#scrollContent {
-                background-color: white;
-                border-radius: 8px;
-                border: 1px solid #BDBDBD;
-            }
-        """)
+        self.scroll_area.setObjectName("criteriaScrollArea")
         self.scroll_content = QWidget()
         self.scroll_content.setObjectName("scrollContent")  # For styling
         self.criteria_layout = QVBoxLayout(self.scroll_content)
@@ -295,65 +321,64 @@ class RubricGrader(QMainWindow):
 
         # Total points display
         self.total_label = QLabel("Total: 0 / 0 points")
-        self.total_label.setStyleSheet("font-size: 14pt; font-weight: bold;")
+        self.total_label.setObjectName("totalLabel")
         bottom_layout.addWidget(self.total_label)
         bottom_layout.addStretch()
 
         # Action buttons at the bottom
-        button_container = QWidget()
-        button_layout = QHBoxLayout(button_container)
+        button_layout = QHBoxLayout()
         button_layout.setContentsMargins(0, 0, 0, 0)
         button_layout.setSpacing(8)
 
         # Batch export button
         batch_export_btn = QPushButton("Batch Export")
-        batch_export_btn.setIcon(qta.icon('fa5s.file-export'))
+        batch_export_btn.setIcon(_cached_icon('fa5s.file-export'))
         batch_export_btn.setToolTip("Export multiple assessments to a directory")
         batch_export_btn.clicked.connect(self.batch_export_assessments)
         button_layout.addWidget(batch_export_btn)
 
         # Clear button
         clear_btn = QPushButton("Clear Form")
-        clear_btn.setIcon(qta.icon('fa5s.eraser'))
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #757575;
-                border: 1px solid #BDBDBD;
-                padding-left: 10px;
-            }
-            QPushButton:hover {
-                background-color: #F5F5F5;
-            }
-        """)
+        clear_btn.setIcon(_cached_icon('fa5s.eraser'))
+        clear_btn.setObjectName("clearButton")
         clear_btn.clicked.connect(self.clear_form)
         button_layout.addWidget(clear_btn)
 
         # Save button
         save_btn = QPushButton("Save Assessment")
-        save_btn.setIcon(qta.icon('fa5s.save'))
+        save_btn.setIcon(_cached_icon('fa5s.save'))
         save_btn.setToolTip("Save assessment to a file")
         save_btn.clicked.connect(self.save_assessment)
         button_layout.addWidget(save_btn)
 
         # Load assessment button
         load_assessment_btn = QPushButton("Load Assessment")
-        load_assessment_btn.setIcon(qta.icon('fa5s.file-upload'))
+        load_assessment_btn.setIcon(_cached_icon('fa5s.file-upload'))
         load_assessment_btn.clicked.connect(self.load_assessment)
         button_layout.addWidget(load_assessment_btn)
 
-        bottom_layout.addWidget(button_container)
+        bottom_layout.addLayout(button_layout)
 
         main_layout.addLayout(bottom_layout)
 
+    def _on_student_name_changed(self, text):
+        """Keep the cached (and sanitized) student name in sync with the field."""
+        self._student_name_cache = text
+        self._sanitized_student = sanitize_filename(text or "unnamed_student")
+        self.mark_dirty()
+
+    def _on_assignment_name_changed(self, text):
+        """Keep the cached assignment name in sync with the field."""
+        self._assignment_name_cache = text
+        self.mark_dirty()
+
     def load_rubric(self, file_path=None, show_config_on_load=True):
         """Load a rubric from a file (JSON or CSV)."""
         if not file_path:
-            file_path, _ = QFileDialog.getOpenFileName(
+            file_path = get_open_file_name(
                 self,
                 "Open Rubric File",
-                "",
-                "Rubric Files (*.json *.csv);;JSON Files (*.json);;CSV Files (*.csv);;All Files (*)"
+                RUBRIC_FILE_FILTER
             )
 
         if not file_path:
@@ -389,12 +414,18 @@ class RubricGrader(QMainWindow):
             from src.utils.layout import setup_rubric_ui
             setup_rubric_ui(self)
 
-            self.export_btn.setEnabled(True)
-            self.config_btn.setEnabled(True)
-            self.abet_mapping_btn.setEnabled(True)
-            self.status_bar.set_status(f"Loaded rubric: {os.path.basename(file_path)}")
-            self.status_label.setText(f"Loaded rubric: {os.path.basename(file_path)}")
-            self.analytics_btn.setEnabled(True)
+            # Enable the buttons and show the status in one repaint
+            message = f"Loaded rubric: {os.path.basename(file_path)}"
+            self.setUpdatesEnabled(False)
+            try:
+                self.export_btn.setEnabled(True)
+                self.config_btn.setEnabled(True)
+                self.abet_mapping_btn.setEnabled(True)
+                self.analytics_btn.setEnabled(True)
+                self.status_bar.set_status(message)
+                self.status_label.setText(message)
+            finally:
+                self.setUpdatesEnabled(True)
 
             # Only show grading config if the flag is True
             if show_config_on_load:
@@ -405,11 +436,27 @@ class RubricGrader(QMainWindow):
 
     def on_criterion_points_changed(self):
         """Handler for when criterion points are changed."""
-        # Use the existing function instead of reimplementing
-        update_total_points(self)
+        self._schedule_total_points_update()
 
     def on_question_selection_changed(self):
         """Handler for when question selection is changed."""
+        self._schedule_total_points_update()
+
+    def _schedule_total_points_update(self):
+        """
+        Recompute the totals once control returns to the event loop.
+
+        Bursts of edits (spinbox steps, level clicks, select all/none)
+        arrive back to back; they all collapse into a single
+        update_total_points call.
+        """
+        if not self._total_points_pending:
+            self._total_points_pending = True
+            QTimer.singleShot(0, self._run_total_points_update)
+
+    def _run_total_points_update(self):
+        """Run the update queued by _schedule_total_points_update."""
+        self._total_points_pending = False
         # Use the existing function instead of reimplementing
         update_total_points(self)
 
@@ -424,29 +471,50 @@ class RubricGrader(QMainWindow):
 
     def update_config_info(self):
         """Update the displayed grading configuration info."""
-        if not self.grading_config:
-            self.config_info.setText("")
+        # Defer the update until the card is actually shown
+        if not self.config_card.isVisible():
+            self._config_info_dirty = True
             return
+        self._config_info_dirty = False
 
         config = self.grading_config
         total_questions = len(self.question_groups) if self.question_groups else "?"
 
-        # Build info text based on grading mode
+        # Skip rebuilding the label when nothing it shows has changed
+        if config:
+            key = (config["grading_mode"], config["questions_to_count"], total_questions,
+                   config["use_fixed_total"], config["fixed_total"],
+                   config["points_per_question"])
+        else:
+            key = None
+        if key == self._last_cfg_key:
+            return
+        self._last_cfg_key = key
+
+        if not config:
+            self.config_info.setText("")
+            return
+
+        # Build info text based on grading mode and points information
         if config["grading_mode"] == "best_scores":
-            info = (f"Grading Mode: Using best {config['questions_to_count']} of {total_questions} "
+            mode = (f"Using best {config['questions_to_count']} of {total_questions} "
                     f"questions for final score")
         else:
-            info = (f"Grading Mode: Counting only {config['questions_to_count']} selected questions")
+            mode = f"Counting only {config['questions_to_count']} selected questions"
 
-        # Add points information
         if config["use_fixed_total"]:
-            info += f"<br>Total possible: {config['fixed_total']} points"
+            points = f"Total possible: {config['fixed_total']} points"
         else:
             total = config['questions_to_count'] * config['points_per_question']
-            info += f"<br>{config['points_per_question']} points per question (Total: {total} points)"
+            points = f"{config['points_per_question']} points per question (Total: {total} points)"
+
+        self.config_info.setText(f"Grading Mode: {mode}\n{points}")
 
-        self.config_info.setText(info)
-        self.config_info.setTextFormat(Qt.RichText)
+    def showEvent(self, event):
+        """Flush any config info update that was deferred while hidden."""
+        super().showEvent(event)
+        if self._config_info_dirty:
+            self.update_config_info()
 
     def show_grading_config(self):
         """Show dialog to configure grading options."""
@@ -469,18 +537,27 @@ class RubricGrader(QMainWindow):
 
         if dialog.exec_() == QDialog.Accepted:
             self.grading_config = dialog.get_config()
-            self.update_config_info()
 
-            # Use existing function from utils.layout
-            setup_question_selection(self)
+            # Rebuild the question checkboxes, totals and summary with
+            # painting suspended so they are laid out once
+            self.setUpdatesEnabled(False)
+            try:
+                self.update_config_info()
 
-            # Use existing function from core.assessment
-            update_total_points(self)
+                # Use existing function from utils.layout (the summary is
+                # rebuilt by update_total_points)
+                setup_question_selection(self, update_summary=False)
+
+                # Use existing function from core.assessment
+                update_total_points(self)
+            finally:
+                self.setUpdatesEnabled(True)
 
     def show_analytics(self):
         """Show the analytics dialog with student performance data."""
+        # Analytics pulls in NumPy/matplotlib, so import it on first use
         from src.ui.dialogs.analytics import AnalyticsDialog
-        # Use the existing function from analytics module
+        from src.analytics.data_processor import collect_assessments
         analytics_data = collect_assessments(self)
 
         if analytics_data:
@@ -495,10 +572,28 @@ class RubricGrader(QMainWindow):
             )
 
     def setup_auto_save(self):
-        """Set up the auto-save timer."""
+        """Set up the single-shot auto-save timer."""
         self.auto_save_timer = QTimer(self)
-        self.auto_save_timer.timeout.connect(self.auto_save_assessment)
-        self.auto_save_timer.start(self.auto_save_interval)
+        self.auto_save_timer.setSingleShot(True)
+        self.auto_save_timer.timeout.connect(self._do_auto_save)
+
+    def mark_dirty(self):
+        """
+        Flag unsaved changes and start the auto-save countdown.
+
+        A running countdown is left alone, so continuous editing still saves
+        at most one interval after the first unsaved change.
+        """
+        self._dirty = True
+        if self.auto_save_timer is not None and not self.auto_save_timer.isActive():
+            self.auto_save_timer.start(self.auto_save_interval)
+
+    def _do_auto_save(self):
+        """Auto-save only if something changed since the last save."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        self.auto_save_assessment()
 
     def auto_save_assessment(self):
         """Automatically save the current assessment to a temporary file."""
@@ -506,67 +601,101 @@ class RubricGrader(QMainWindow):
         if not self.rubric_data or not self.criterion_widgets:
             return
 
+        # Never overlap writes; save again once the current one finishes
+        if self._auto_save_in_flight:
+            self._auto_save_pending = True
+            return
+
         # Get assessment data without validation
         assessment_data = get_assessment_data(self, validate=False)
         if not assessment_data:
             return
 
         # Create a unique filename based on student name and timestamp
-        student_name = self.student_name_edit.text() or "unnamed_student"
-        student_name = ''.join(c if c.isalnum() else '_' for c in student_name)  # Sanitize filename
         timestamp = int(time.time())
-        filename = f"autosave_{student_name}_{timestamp}.json"
-        file_path = os.path.join(self.auto_save_dir, filename)
+        prefix = f"autosave_{self._sanitized_student}_"
+        file_path = os.path.join(self.auto_save_dir, f"{prefix}{timestamp}.json")
 
         try:
-            with open(file_path, 'w') as file:
-                json.dump(assessment_data, file, indent=2)
-
-            # Update status bar
-            current_time = time.strftime("%H:%M:%S")
-            self.status_bar.set_auto_save_status(f"Saved at {current_time}")
-            self.status_bar.show_temporary_message("Assessment auto-saved")
-
-            # Clean up old auto-save files (keep only the 5 most recent)
-            self.cleanup_auto_save_files()
+            payload = dump_json_bytes(assessment_data, compact=True)
         except Exception as e:
             self.status_bar.set_auto_save_status(f"Failed: {str(e)}", is_error=True)
+            return
+
+        # Edits were undone since the last auto-save: nothing new to write
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == self._last_autosave_digest:
+            return
+        self._last_autosave_digest = digest
+
+        # Write (and prune old auto-saves) on a pool thread
+        stale_paths = track_auto_save(self, prefix, file_path)
+        task = AutoSaveTask(payload, file_path, stale_paths)
+        task.signals.finished.connect(self._on_auto_save_finished)
+        task.signals.failed.connect(self._on_auto_save_failed)
+        self._auto_save_in_flight = True
+        QThreadPool.globalInstance().start(task)
+
+    def _on_auto_save_finished(self, file_path):
+        """Report a completed background auto-save."""
+        self._auto_save_in_flight = False
+
+        # Update status bar
+        current_time = time.strftime("%H:%M:%S")
+        self.status_bar.set_auto_save_status(f"Saved at {current_time}")
+        self.status_bar.show_temporary_message("Assessment auto-saved")
+        self._run_pending_auto_save()
+
+    def _on_auto_save_failed(self, message):
+        """Report a failed background auto-save."""
+        self._auto_save_in_flight = False
+        self._last_autosave_digest = None
+        forget_auto_saves(self)  # Nothing was removed; rescan next time
+        self.mark_dirty()  # Retry after the next auto-save interval
+        self.status_bar.set_auto_save_status(f"Failed: {message}", is_error=True)
+        self._run_pending_auto_save()
+
+    def _run_pending_auto_save(self):
+        """Start the auto-save that was requested while a write was running."""
+        if self._auto_save_pending:
+            self._auto_save_pending = False
+            self.auto_save_assessment()
+
+    def _flush_auto_save(self):
+        """Finish any background write and synchronously save pending changes."""
+        pool = QThreadPool.globalInstance()
+        self.auto_save_timer.stop()
+        pool.waitForDone()
+        self._auto_save_in_flight = False
+        if self._auto_save_pending:
+            self._auto_save_pending = False
+            self._dirty = True
+        self._do_auto_save()
+        pool.waitForDone()
 
     def cleanup_auto_save_files(self):
         """Remove old auto-save files, keeping only the most recent ones."""
-        try:
-            # Get all auto-save files for the current student
-            student_name = self.student_name_edit.text() or "unnamed_student"
-            student_name = ''.join(c if c.isalnum() else '_' for c in student_name)
-
-            all_files = []
-            for filename in os.listdir(self.auto_save_dir):
-                if filename.startswith(f"autosave_{student_name}_") and filename.endswith(".json"):
-                    file_path = os.path.join(self.auto_save_dir, filename)
-                    all_files.append((file_path, os.path.getmtime(file_path)))
-
-            # Sort by modification time (newest first)
-            all_files.sort(key=lambda x: x[1], reverse=True)
-
-            # Keep only the 5 most recent files
-            for file_path, _ in all_files[5:]:
-                os.remove(file_path)
-        except Exception:
-            # Silently fail - this is just cleanup
-            pass
+        prune_auto_save_files(self.auto_save_dir, f"autosave_{self._sanitized_student}_")
 
     def clear_form(self):
         """Clear all entered data."""
         self.student_name_edit.clear()
         self.assignment_name_edit.clear()
 
-        for widget in self.criterion_widgets:
-            widget.reset()
-
-        # Reset checkboxes if they exist
-        if hasattr(self, 'question_checkboxes'):
-            for checkbox in self.question_checkboxes.values():
-                checkbox.setChecked(True)
+        # Reset everything with signals blocked so the total is recomputed once
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            for widget in self.criterion_widgets:
+                widget.blockSignals(True)
+                widget.reset()
+                widget.blockSignals(False)
+
+            # Reset checkboxes if they exist
+            if hasattr(self, 'question_checkboxes'):
+                for checkbox in self.question_checkboxes.values():
+                    checkbox.setChecked(True)
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
 
         # Use existing function from core.assessment
         update_total_points(self)
@@ -595,18 +724,18 @@ class RubricGrader(QMainWindow):
             default_path = self.current_assessment_path
         else:
             # Create a suggested filename based on student and assignment
-            student = self.student_name_edit.text()
-            assignment = self.assignment_name_edit.text()
+            student = self._student_name_cache
+            assignment = self._assignment_name_cache
             if student and assignment:
-                safe_student = ''.join(c if c.isalnum() else '_' for c in student)
-                safe_assignment = ''.join(c if c.isalnum() else '_' for c in assignment)
+                safe_student = self._sanitized_student
+                safe_assignment = sanitize_filename(assignment)
                 default_path = f"{safe_assignment}_{safe_student}.json"
 
-        file_path, _ = QFileDialog.getSaveFileName(
+        file_path = get_save_file_name(
             self,
             "Save Assessment",
             default_path,
-            "JSON Files (*.json);;All Files (*)"
+            JSON_FILE_FILTER
         )
 
         if not file_path:
@@ -617,8 +746,7 @@ class RubricGrader(QMainWindow):
             file_path += '.json'
 
         try:
-            with open(file_path, 'w') as file:
-                json.dump(assessment_data, file, indent=2)
+            write_file_atomic(file_path, dump_json_bytes(assessment_data), fsync=True)
 
             # Update current assessment path
             self.current_assessment_path = file_path
@@ -633,19 +761,17 @@ class RubricGrader(QMainWindow):
 
     def load_assessment(self):
         """Load a previously saved assessment."""
-        file_path, _ = QFileDialog.getOpenFileName(
+        file_path = get_open_file_name(
             self,
             "Open Assessment File",
-            "",
-            "JSON Files (*.json);;All Files (*)"
+            JSON_FILE_FILTER
         )
 
         if not file_path:
             return
 
         try:
-            with open(file_path, 'r') as file:
-                assessment_data = json.load(file)
+            assessment_data = read_json_file(file_path)
 
             # Use existing function from core.grader
             if not is_valid_assessment(assessment_data):
@@ -726,19 +852,21 @@ class RubricGrader(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load assessment: {str(e)}")
 
-    # Use existing functions from utils.pdf
+    # Use existing functions from utils.pdf (imported on first use)
     def export_to_pdf(self):
+        from src.utils.pdf import export_to_pdf
         export_to_pdf(self)
 
     def batch_export_assessments(self):
+        from src.utils.pdf import batch_export_assessments
         batch_export_assessments(self)
 
     def closeEvent(self, event):
         """Handle application close event to check for unsaved changes."""
         # Check if we have unsaved changes
         if self.rubric_data and self.criterion_widgets:
-            # Perform one final auto-save
-            self.auto_save_assessment()
+            # Perform one final auto-save if anything changed
+            self._flush_auto_save()
 
             # Check if there are unsaved changes (if auto-save is disabled)
             if self.current_assessment_path is None:
@@ -762,6 +890,13 @@ class RubricGrader(QMainWindow):
         else:
             event.accept()
 
+        # Let PDF exports still rendering finish their files; destroying a
+        # running QThread aborts the application
+        if event.isAccepted():
+            for thread, _worker in list(getattr(self, '_pdf_exports', ())):
+                thread.quit()
+                thread.wait()
+
     def show_abet_mapping(self):
         """Show the full Phase 4 ABET mapping dialog."""
         if not self.rubric_data:
@@ -781,6 +916,7 @@ class RubricGrader(QMainWindow):
             except Exception:
                 pass
 
+            from src.ui.dialogs.abet_dialogs import ABETMappingDialog
             dialog = ABETMappingDialog(self.rubric_data, self, profile=profile)
             if dialog.exec_() == QDialog.Accepted:
                 # If user clicked "Save into rubric", rubric_data was mutated in-place.
@@ -802,6 +938,7 @@ class RubricGrader(QMainWindow):
     def show_abet_report(self):
         """Show the Phase 4 ABET assignment-level report dialog."""
         try:
+            from src.ui.dialogs.abet_dialogs import ABETReportDialog
             dialog = ABETReportDialog(self, rubric_data=self.rubric_data or {})
             dialog.exec_()
         except Exception as e:
@@ -811,6 +948,7 @@ class RubricGrader(QMainWindow):
     def show_semester_abet_report(self):
         """Show the Phase 3+4 semester-level ABET aggregation dialog."""
         try:
+            from src.ui.dialogs.abet_dialogs import SemesterABETReportDialog
             dialog = SemesterABETReportDialog(self)
             dialog.exec_()
         except Exception as e:
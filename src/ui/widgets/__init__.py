@@ -8,13 +8,20 @@ from .criterion import CriterionWidget
 from .header import HeaderWidget
 from .status_bar import StatusBarWidget
 from .card import CardWidget
-from .canvas import MatplotlibCanvas
 from .action_button import FloatingActionButton
 from .grade_scale import GradeScaleWidget
 from .info_panel import RubricInfoWidget
 from .math_editor import MarkdownMathEditor
 
 
+def __getattr__(name):
+    # MatplotlibCanvas pulls in matplotlib; only import it when first used
+    if name == 'MatplotlibCanvas':
+        from .canvas import MatplotlibCanvas
+        return MatplotlibCanvas
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 
 __all__ = [
     'CriterionWidget',
@@ -4,6 +4,8 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 class MatplotlibCanvas(FigureCanvasQTAgg):
     def __init__(self, parent=None, dpi=100):
         self.fig = Figure(figsize=(5, 4), dpi=dpi)
+        # Constrained layout is applied at draw time, so no layout pass is
+        # needed here while the axes are still empty
+        self.fig.set_layout_engine('constrained')
         self.axes = self.fig.add_subplot(111)
         super(MatplotlibCanvas, self).__init__(self.fig)
-        self.fig.tight_layout()
\ No newline at end of file
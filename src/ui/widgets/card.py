@@ -1,6 +1,8 @@
 from PyQt5.QtWidgets import QFrame, QVBoxLayout, QLabel, QHBoxLayout
 from PyQt5.QtCore import Qt
 
+from src.utils.styles import CARD_QSS, install_stylesheet
+
 
 class CardWidget(QFrame):
     """Card-style container widget with title and content."""
@@ -12,20 +14,8 @@ class CardWidget(QFrame):
 
     def setup_ui(self):
         """Set up the card UI."""
-        self.setStyleSheet("""
-            CardWidget {
-                background-color: white;
-                border-radius: 4px;
-                border: 1px solid #EEEEEE;
-                margin: 8px 0px;
-            }
-            QLabel[labelType="cardTitle"] {
-                font-size: 14px;
-                font-weight: bold;
-                color: white;
-                padding: 8px;
-            }
-        """)
+        install_stylesheet(CARD_QSS)
+        self.setObjectName("CardWidgetRoot")
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -33,7 +23,7 @@ class CardWidget(QFrame):
 
         # Title bar
         title_bar = QFrame()
-        title_bar.setStyleSheet("background-color: #3F51B5; border-radius: 4px 4px 0 0;")
+        title_bar.setObjectName("CardTitleBar")
         title_layout = QHBoxLayout(title_bar)
 
         title_label = QLabel(self.title)
@@ -44,7 +34,7 @@ class CardWidget(QFrame):
 
         # Content container
         self.content = QFrame()
-        self.content.setStyleSheet("border-radius: 0 0 4px 4px;")
+        self.content.setObjectName("CardContent")
         self.content_layout = QVBoxLayout(self.content)
         self.content_layout.setContentsMargins(12, 12, 12, 12)
 
@@ -5,9 +5,14 @@ This module defines the UI component that represents a single criterion in the r
 """
 
 from PyQt5.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel,
-                           QSpinBox, QCheckBox, QGroupBox, QTextEdit, QSizePolicy, QDoubleSpinBox)
-from PyQt5.QtCore import Qt, pyqtSignal
+                           QSpinBox, QCheckBox, QGroupBox, QButtonGroup, QTextEdit, QSizePolicy, QDoubleSpinBox)
+from PyQt5.QtCore import Qt, QEvent, pyqtSignal
 from src.ui.widgets.math_editor import MarkdownMathEditor
+from src.core.rubric import parse_levels
+from src.utils.styles import CRITERION_QSS, install_stylesheet
+
+# Shared by every comments editor (setSizePolicy copies the value)
+_COMMENTS_SIZE_POLICY = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
 
 class CriterionWidget(QFrame):
@@ -16,6 +21,11 @@ class CriterionWidget(QFrame):
     # Signal emitted when points are changed
     points_changed = pyqtSignal()
 
+    # Show each level's description as a label under its checkbox. When
+    # False the description is only the checkbox tooltip, which saves a
+    # wrapped QLabel per level.
+    show_level_descriptions = True
+
     def __init__(self, criterion_data, parent=None):
         """
         Initialize the criterion widget.
@@ -28,85 +38,43 @@ class CriterionWidget(QFrame):
         self.setFrameStyle(QFrame.Box | QFrame.Raised)
         self.setLineWidth(1)
         self.criterion_data = criterion_data
+        self._pending_levels = None  # Level definitions not yet turned into widgets
+        self._checked_level = None  # Currently checked level checkbox, if any
+        self._level_titles = {}  # {checkbox: level name saved in assessments}
+        self._level_by_title = {}  # {level name: checkbox}
+        self._cached_data = None  # Last get_data() result, None once anything changes
+        self._level_group = None  # QButtonGroup of the built level checkboxes
 
-        # Apply material design style
-        self.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 4px;
-                border: 1px solid #EEEEEE;
-                margin: 4px;
-                padding: 8px;
-            }
-            QFrame:hover {
-                border: 1px solid #BDBDBD;
-                background-color: #FAFAFA;
-            }
-            QLabel[labelType="criterionTitle"] {
-                font-size: 14px;
-                font-weight: bold;
-                color: #3F51B5;
-            }
-            QLabel[labelType="criterionDescription"] {
-                color: #757575;
-                font-style: italic;
-                margin-bottom: 8px;
-            }
-            QGroupBox {
-                margin-top: 16px;
-            }
-            QCheckBox {
-                padding: 4px;
-                border-radius: 4px;
-            }
-            QCheckBox:hover {
-                background-color: #F5F5F5;
-            }
-            QTextEdit {
-                border: 1px solid #BDBDBD;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QTextEdit:focus {
-                border: 2px solid #3F51B5;
-            }
-        """)
+        self.setObjectName("criterionCard")  # Styled by CRITERION_QSS
 
         self.setup_ui()
 
     def setup_ui(self):
         """Set up the user interface for this criterion."""
+        install_stylesheet(CRITERION_QSS)
         layout = QVBoxLayout()
+        self._main_layout = layout
 
         # Criterion title with styled font
-        title_label = QLabel(self.criterion_data.get("title", "Untitled Criterion"))
-        title_label.setProperty("labelType", "criterionTitle")
-        layout.addWidget(title_label)
+        self._title_label = QLabel(self.criterion_data.get("title", "Untitled Criterion"))
+        self._title_label.setProperty("labelType", "criterionTitle")
+        layout.addWidget(self._title_label)
 
         # Description
+        self._description_label = None
         description = self.criterion_data.get("description", "")
         if description:
-            desc_label = QLabel(description)
-            desc_label.setProperty("labelType", "criterionDescription")
-            desc_label.setWordWrap(True)
-            layout.addWidget(desc_label)
+            self._description_label = self._create_description_label(description)
+            layout.addWidget(self._description_label)
 
         # Points controls in a styled container
         points_container = QFrame()
-        points_container.setStyleSheet("""
-            QFrame {
-                background-color: #F5F5F5;
-                border-radius: 4px;
-                border: none;
-                margin: 0px;
-                padding: 8px;
-            }
-        """)
+        points_container.setObjectName("pointsContainer")
         points_layout = QHBoxLayout(points_container)
         points_layout.setContentsMargins(8, 8, 8, 8)
 
         points_label = QLabel("Points:")
-        points_label.setStyleSheet("font-weight: bold;")
+        points_label.setObjectName("pointsLabel")
         points_layout.addWidget(points_label)
 
         self.points_spinbox = QDoubleSpinBox()
@@ -116,97 +84,22 @@ class CriterionWidget(QFrame):
         self.points_spinbox.setRange(0, self.max_points)
         self.points_spinbox.setToolTip(f"Maximum points: {self.max_points}")
         self.points_spinbox.valueChanged.connect(self.points_changed)
-        self.points_spinbox.setStyleSheet("""
-            QSpinBox {
-                background-color: white;
-                border: 1px solid #BDBDBD;
-                border-radius: 4px;
-                padding: 4px;
-                min-width: 60px;
-            }
-            QSpinBox:focus {
-                border: 2px solid #3F51B5;
-            }
-        """)
+        self.points_spinbox.valueChanged.connect(self._invalidate_data)
         points_layout.addWidget(self.points_spinbox)
 
-        points_layout.addWidget(QLabel(f"/ {self.max_points}"))
+        self._max_points_label = QLabel(f"/ {self.max_points}")
+        points_layout.addWidget(self._max_points_label)
         points_layout.addStretch()
         layout.addWidget(points_container)
 
-        # Achievement levels if present
+        # Achievement levels if present. The level rows are built when the
+        # group is first shown (or when set_data needs them).
+        self._levels_group = None
         levels = self.criterion_data.get("levels", [])
         if levels:
-            levels_group = QGroupBox("Achievement Levels")
-            levels_group.setStyleSheet("""
-                QGroupBox {
-                    font-weight: bold;
-                    border: 1px solid #BDBDBD;
-                    border-radius: 4px;
-                    margin-top: 16px;
-                    padding-top: 8px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                }
-            """)
-            levels_layout = QVBoxLayout()
-
-            self.level_checkboxes = []
-            for level in levels:
-                level_container = QFrame()
-                level_container.setStyleSheet("""
-                    QFrame {
-                        border: none;
-                        border-radius: 0px;
-                        margin: 0px;
-                        padding: 0px;
-                    }
-                    QFrame:hover {
-                        background-color: #F5F5F5;
-                    }
-                """)
-                level_layout = QVBoxLayout(level_container)
-                level_layout.setContentsMargins(0, 4, 0, 4)
-
-                # Checkbox and points in a horizontal layout
-                checkbox_layout = QHBoxLayout()
-
-                level_checkbox = QCheckBox(f"{level.get('title')} ({level.get('points')} pts)")
-                level_checkbox.setStyleSheet("""
-                    QCheckBox {
-                        font-weight: bold;
-                    }
-                """)
-
-                level_description = level.get("description", "")
-                if level_description:
-                    level_checkbox.setToolTip(level_description)
-
-                level_checkbox.clicked.connect(self.update_points_from_level)
-                self.level_checkboxes.append((level_checkbox, level.get("points", 0)))
-                checkbox_layout.addWidget(level_checkbox)
-
-                # Show points on the right
-                # points_label = QLabel(f"{level.get('points')} pts")
-                # points_label.setStyleSheet("color: #757575;")
-                # checkbox_layout.addWidget(points_label)
-
-                level_layout.addLayout(checkbox_layout)
-
-                # Show description if available
-                if level_description:
-                    desc_label = QLabel(level_description)
-                    desc_label.setWordWrap(True)
-                    desc_label.setStyleSheet("color: #757575; padding-left: 24px; font-size: 12px;")
-                    level_layout.addWidget(desc_label)
-
-                levels_layout.addWidget(level_container)
-
-            levels_group.setLayout(levels_layout)
-            layout.addWidget(levels_group)
+            self._create_levels_group()
+            self._pending_levels = parse_levels(levels)
+            layout.addWidget(self._levels_group)
 
         # Comments area with improved styling
         # layout.addWidget(QLabel("Comments:"))
@@ -217,52 +110,203 @@ class CriterionWidget(QFrame):
         # size_policy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         # self.comments_edit.setSizePolicy(size_policy)
         # layout.addWidget(self.comments_edit)
-        comment_label = QLabel("Comments (supports Markdown and LaTeX math with $...$ or $$...$$):")
-        layout.addWidget(comment_label)
+        self._comments_label = QLabel("Comments (supports Markdown and LaTeX math with $...$ or $$...$$):")
+        layout.addWidget(self._comments_label)
         self.comments_edit = MarkdownMathEditor()
         self.comments_edit.setMinimumHeight(150)  # Make it a bit taller to accommodate the preview
-        size_policy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.comments_edit.setSizePolicy(size_policy)
+        self.comments_edit.setSizePolicy(_COMMENTS_SIZE_POLICY)
+        self.comments_edit.textChanged.connect(self._invalidate_data)
         layout.addWidget(self.comments_edit)
 
         self.setLayout(layout)
 
-    def update_points_from_level(self):
-        """Update the points value based on the selected achievement level."""
-        sender = self.sender()
+    def _create_description_label(self, description):
+        """Create the wrapped, italic criterion description label."""
+        desc_label = QLabel(description)
+        desc_label.setProperty("labelType", "criterionDescription")
+        desc_label.setWordWrap(True)
+        return desc_label
+
+    def _create_levels_group(self):
+        """Create the (still empty) achievement levels group box."""
+        self._levels_group = QGroupBox("Achievement Levels")
+        self._levels_layout = QVBoxLayout()
+        self._levels_group.setLayout(self._levels_layout)
+        self.level_checkboxes = []
+        self._levels_group.installEventFilter(self)
+
+    def rebind(self, criterion_data):
+        """
+        Show a different criterion, reusing this widget and its children.
+
+        Signal connections made to the widget are kept. The widget ends up
+        in the same state as a new one built for criterion_data, with no
+        points, level or comments.
+
+        Args:
+            criterion_data (dict): Dictionary containing the criterion definition
+        """
+        self.criterion_data = criterion_data
+        self._title_label.setText(criterion_data.get("title", "Untitled Criterion"))
+
+        description = criterion_data.get("description", "")
+        if self._description_label is not None:
+            self._description_label.setText(description)
+            self._description_label.setVisible(bool(description))
+        elif description:
+            self._description_label = self._create_description_label(description)
+            self._main_layout.insertWidget(1, self._description_label)
+
+        self.reset()
+        self.max_points = criterion_data.get("points", 10)
+        self.points_spinbox.setRange(0, self.max_points)
+        self.points_spinbox.setToolTip(f"Maximum points: {self.max_points}")
+        self._max_points_label.setText(f"/ {self.max_points}")
+
+        self._clear_levels()
+        levels = criterion_data.get("levels", [])
+        if levels:
+            if self._levels_group is None:
+                self._create_levels_group()
+                self._main_layout.insertWidget(
+                    self._main_layout.indexOf(self._comments_label), self._levels_group)
+            self._pending_levels = parse_levels(levels)
+            self._levels_group.setVisible(True)
+            # Already on screen, so no Show event will build the rows
+            if self._pending_levels and self._levels_group.isVisible():
+                self._populate_levels()
+        elif self._levels_group is not None:
+            self._levels_group.setVisible(False)
+        self._cached_data = None
+
+    def _clear_levels(self):
+        """Delete any built level rows and forget the level selection."""
+        self._pending_levels = None
+        self._checked_level = None
+        self._level_titles = {}
+        self._level_by_title = {}
+        if self._level_group is not None:
+            self._level_group.deleteLater()
+            self._level_group = None
+        if self._levels_group is not None:
+            self.level_checkboxes = []
+            while self._levels_layout.count():
+                row = self._levels_layout.takeAt(self._levels_layout.count() - 1).widget()
+                if row is not None:
+                    row.deleteLater()
+
+    def eventFilter(self, obj, event):
+        """Build the achievement level rows the first time their group is shown."""
+        if event.type() == QEvent.Show and self._pending_levels:
+            self._populate_levels()
+        return super().eventFilter(obj, event)
+
+    def _populate_levels(self):
+        """Create the checkbox and description rows for the pending levels."""
+        levels = self._pending_levels
+        if not levels:
+            return
+        self._pending_levels = None
+
+        # The group is not exclusive so reset() can still uncheck every level;
+        # _on_level_toggled enforces the single selection instead.
+        self._level_group = QButtonGroup(self)
+        self._level_group.setExclusive(False)
+        self._level_group.buttonToggled.connect(self._on_level_toggled)
+        self._level_group.buttonClicked.connect(self.update_points_from_level)
+        self._level_points = {}
+
+        # Build every row unparented, then add them in one pass with painting
+        # suspended, since this runs while the group is being shown
+        group = self._levels_layout.parentWidget()
+        group.setUpdatesEnabled(False)
+        try:
+            level_containers = []
+            for level in levels:
+                level_container = QFrame()
+                level_container.setObjectName("levelRow")
+                level_layout = QVBoxLayout(level_container)
+                level_layout.setContentsMargins(0, 4, 0, 4)
+
+                level_checkbox = QCheckBox(level.label)
+
+                level_description = level.description
+                if level_description:
+                    level_checkbox.setToolTip(level_description)
+
+                self._level_group.addButton(level_checkbox)
+                self._level_points[level_checkbox] = level.points
+                # Assessments store the label text before " (", so key on that
+                level_title = level.label.split(" (")[0]
+                self._level_titles[level_checkbox] = level_title
+                self._level_by_title.setdefault(level_title, level_checkbox)
+                self.level_checkboxes.append((level_checkbox, level.points))
+                # The points are part of the label, so the checkbox sits
+                # directly in the row layout
+                level_layout.addWidget(level_checkbox)
 
-        # Uncheck other boxes
-        for checkbox, points in self.level_checkboxes:
-            if checkbox != sender and checkbox.isChecked():
-                checkbox.setChecked(False)
+                # Show description if available
+                if level_description and self.show_level_descriptions:
+                    desc_label = QLabel(level_description)
+                    desc_label.setWordWrap(True)
+                    desc_label.setObjectName("levelDescription")
+                    level_layout.addWidget(desc_label)
 
-        # Update points if a box is checked
-        for checkbox, points in self.level_checkboxes:
-            if checkbox.isChecked():
-                self.points_spinbox.setValue(points)
+                level_containers.append(level_container)
+
+            for level_container in level_containers:
+                self._levels_layout.addWidget(level_container)
+        finally:
+            group.setUpdatesEnabled(True)
+
+    def _on_level_toggled(self, checkbox, checked):
+        """Keep at most one level checked by unchecking the previous one."""
+        self._cached_data = None
+        if checked:
+            previous, self._checked_level = self._checked_level, checkbox
+            if previous is not None and previous is not checkbox:
+                previous.setChecked(False)
+        elif checkbox is self._checked_level:
+            self._checked_level = None
+
+    def update_points_from_level(self, checkbox):
+        """Update the points value based on the clicked achievement level."""
+        if checkbox.isChecked():
+            previous = self.points_spinbox.value()
+            self.points_spinbox.setValue(self._level_points[checkbox])
+            # A new value already emitted points_changed through valueChanged;
+            # a level with the same points is still an edit worth reporting
+            if self.points_spinbox.value() == previous:
                 self.points_changed.emit()
-                return
+        else:
+            # Clearing the level leaves the points alone but still changes
+            # the saved selected_level
+            self.points_changed.emit()
+
+    def _invalidate_data(self, *args):
+        """Drop the cached get_data() result after an edit."""
+        self._cached_data = None
 
     def get_data(self):
         """
         Get the current state of this criterion.
 
+        The result is cached until the points, level or comments change;
+        callers get their own copy so they can add keys to it.
+
         Returns:
             dict: Dictionary containing the criterion data
         """
-        selected_level = None
-        for checkbox, _ in getattr(self, 'level_checkboxes', []):
-            if checkbox.isChecked():
-                selected_level = checkbox.text().split(" (")[0]
-
-        return {
-            "id": self.criterion_data.get("id", ""),
-            "title": self.criterion_data.get("title", ""),
-            "points_awarded": self.points_spinbox.value(),
-            "points_possible": self.criterion_data.get("points", 0),
-            "selected_level": selected_level,
-            "comments": self.comments_edit.get_text(),
-        }
+        if self._cached_data is None:
+            self._cached_data = {
+                "id": self.criterion_data.get("id", ""),
+                "title": self.criterion_data.get("title", ""),
+                "points_awarded": self.points_spinbox.value(),
+                "points_possible": self.criterion_data.get("points", 0),
+                "selected_level": self._level_titles.get(self._checked_level),
+                "comments": self.comments_edit.get_text(),
+            }
+        return dict(self._cached_data)
 
     def set_data(self, criterion_data):
         """
@@ -280,10 +324,10 @@ class CriterionWidget(QFrame):
         # Set level if applicable
         selected_level = criterion_data.get("selected_level", "")
         if selected_level and hasattr(self, 'level_checkboxes'):
-            for checkbox, _ in self.level_checkboxes:
-                if checkbox.text().split(" (")[0] == selected_level:
-                    checkbox.setChecked(True)
-                    break
+            self._populate_levels()
+            checkbox = self._level_by_title.get(selected_level)
+            if checkbox is not None:
+                checkbox.setChecked(True)
 
     def reset(self):
         """Reset the widget to its initial state."""
@@ -1,7 +1,29 @@
+from functools import lru_cache
+
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QSizePolicy
 from PyQt5.QtGui import QFont, QPixmap
 from PyQt5.QtCore import Qt
 
+from src.utils.styles import HEADER_QSS, install_stylesheet
+
+
+# Built on first use: QPixmap needs a running QApplication
+@lru_cache(maxsize=None)
+def _empty_logo():
+    """Return the shared transparent placeholder logo."""
+    pixmap = QPixmap(32, 32)
+    pixmap.fill(Qt.transparent)
+    return pixmap
+
+
+@lru_cache(maxsize=None)
+def _title_font():
+    """Return the shared header title font."""
+    font = QFont()
+    font.setPointSize(16)
+    font.setBold(True)
+    return font
+
 
 class HeaderWidget(QWidget):
     """Custom app header with logo and title."""
@@ -12,28 +34,25 @@ class HeaderWidget(QWidget):
 
     def setup_ui(self):
         """Set up the header UI."""
+        install_stylesheet(HEADER_QSS)
+        self.setObjectName("appHeader")
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
         # Create logo (placeholder - replace with actual logo)
         logo_label = QLabel()
-        logo_pixmap = QPixmap(32, 32)
-        logo_pixmap.fill(Qt.transparent)
-        logo_label.setPixmap(logo_pixmap)
+        logo_label.setPixmap(_empty_logo())
         layout.addWidget(logo_label)
 
         # App title
         title_label = QLabel("Rubric Grading Tool")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet("color: #3F51B5;")
+        title_label.setFont(_title_font())
+        title_label.setObjectName("appTitle")
         layout.addWidget(title_label)
 
         # Fill remaining space
         layout.addStretch()
 
         # Set fixed height
-        self.setFixedHeight(48)
-        self.setStyleSheet("background-color: white; border-bottom: 1px solid #BDBDBD;")
\ No newline at end of file
+        self.setFixedHeight(48)
\ No newline at end of file
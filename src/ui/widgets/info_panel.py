@@ -8,6 +8,8 @@ class RubricInfoWidget(QFrame):
         """Initialize the widget."""
         super().__init__(parent)
         self.setFrameStyle(QFrame.StyledPanel)
+        self._rubric = None  # Rubric currently displayed (kept to skip repeat updates)
+        self._total_points = 0
         self.setup_ui()
 
     def setup_ui(self):
@@ -29,16 +31,28 @@ class RubricInfoWidget(QFrame):
             self.reset()
             return
 
+        # The same rubric is already displayed; use adjust_total for edits
+        if rubric_data is self._rubric:
+            return
+        self._rubric = rubric_data
+
         self.title_label.setText(rubric_data.get("title", "Untitled Rubric"))
 
-        criteria_count = len(rubric_data.get("criteria", []))
-        self.criteria_count_label.setText(f"Criteria: {criteria_count}")
+        criteria = rubric_data.get("criteria", [])
+        self.criteria_count_label.setText(f"Criteria: {len(criteria)}")
+
+        self._total_points = sum(c.get("points", 0) for c in criteria)
+        self.points_label.setText(f"Total points: {self._total_points}")
 
-        total_points = sum(c.get("points", 0) for c in rubric_data.get("criteria", []))
-        self.points_label.setText(f"Total points: {total_points}")
+    def adjust_total(self, delta):
+        """Change the displayed total by delta when a single criterion changes."""
+        self._total_points += delta
+        self.points_label.setText(f"Total points: {self._total_points}")
 
     def reset(self):
         """Reset the widget to its initial state."""
+        self._rubric = None
+        self._total_points = 0
         self.title_label.setText("No rubric loaded")
         self.criteria_count_label.setText("Criteria: 0")
         self.points_label.setText("Total points: 0")
\ No newline at end of file
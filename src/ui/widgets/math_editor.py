@@ -1,9 +1,12 @@
 from PyQt5.QtWidgets import QTextEdit, QVBoxLayout, QWidget
+from PyQt5.QtCore import pyqtSignal
 
 
 class MarkdownMathEditor(QWidget):
     """Simple text editor that supports math input"""
 
+    textChanged = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -13,6 +16,7 @@ class MarkdownMathEditor(QWidget):
         # Regular text editor for input
         self.editor = QTextEdit()
         self.editor.setPlaceholderText("Enter feedback....")
+        self.editor.textChanged.connect(self.textChanged)
         layout.addWidget(self.editor)
 
     def get_text(self):
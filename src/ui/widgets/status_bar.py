@@ -1,6 +1,8 @@
 from PyQt5.QtWidgets import QStatusBar, QLabel, QProgressBar, QHBoxLayout, QWidget
 from PyQt5.QtCore import Qt, QTimer
 
+from src.utils.styles import STATUS_BAR_QSS, install_stylesheet
+
 
 class StatusBarWidget(QStatusBar):
     """Enhanced status bar with auto-save indicator and version information."""
@@ -12,16 +14,15 @@ class StatusBarWidget(QStatusBar):
 
     def setup_ui(self):
         """Set up the status bar UI."""
-        self.setStyleSheet("""
-            QStatusBar {
-                background-color: #3F51B5;
-                color: white;
-            }
-            QStatusBar QLabel {
-                color: white;
-                padding: 3px;
-            }
-        """)
+        install_stylesheet(STATUS_BAR_QSS)
+        self.setObjectName("appStatusBar")
+
+        # One timer restores the status after temporary messages; repeated
+        # messages restart it instead of queueing more restores
+        self._temp_timer = QTimer(self)
+        self._temp_timer.setSingleShot(True)
+        self._temp_timer.timeout.connect(self._restore_status)
+        self._saved_status = None
 
         # Status message
         self.status_label = QLabel("Ready")
@@ -36,6 +37,8 @@ class StatusBarWidget(QStatusBar):
         auto_save_layout.addWidget(self.auto_save_label)
 
         self.auto_save_status = QLabel("Ready")
+        self.auto_save_status.setObjectName("autoSaveStatus")
+        self._auto_save_is_error = False
         auto_save_layout.addWidget(self.auto_save_status)
 
         self.addPermanentWidget(self.auto_save_container)
@@ -47,30 +50,37 @@ class StatusBarWidget(QStatusBar):
 
         # Version information (from the StatusBar class)
         self.version_label = QLabel("v1.0.0")
-        self.version_label.setStyleSheet("color: rgba(255, 255, 255, 0.7);")
+        self.version_label.setObjectName("versionLabel")
         self.addPermanentWidget(self.version_label)
 
     def set_status(self, message):
         """Set the status message."""
         self.status_label.setText(message)
+        if self._saved_status is not None:
+            self._saved_status = message  # Restore this, not the older status
 
     def set_auto_save_status(self, status, is_error=False):
         """Set the auto-save status."""
         self.auto_save_status.setText(status)
-        if is_error:
-            self.auto_save_status.setStyleSheet("color: #FFCDD2;")  # Light red
-        else:
-            self.auto_save_status.setStyleSheet("color: white;")
+        # Restyle (light red for errors) only when the state actually flips
+        if is_error != self._auto_save_is_error:
+            self._auto_save_is_error = is_error
+            self.auto_save_status.setProperty("autoSaveState", "error" if is_error else "ok")
+            self.auto_save_status.style().unpolish(self.auto_save_status)
+            self.auto_save_status.style().polish(self.auto_save_status)
 
     def show_temporary_message(self, message, duration=3000):
         """Show a temporary message and revert back after duration."""
-        old_message = self.status_label.text()
+        if self._saved_status is None:
+            self._saved_status = self.status_label.text()
         self.status_label.setText(message)
+        self._temp_timer.start(duration)
 
-        def restore():
-            self.status_label.setText(old_message)
-
-        QTimer.singleShot(duration, restore)
+    def _restore_status(self):
+        """Put back the status that was showing before the temporary messages."""
+        if self._saved_status is not None:
+            self.status_label.setText(self._saved_status)
+            self._saved_status = None
 
     def set_version(self, version):
         """Set the version display text."""
@@ -6,15 +6,359 @@ including rubrics, assessments, and auto-save functionality.
 """
 
 import os
+import re
 import json
 import time
+import hashlib
+import heapq
+import tempfile
+from collections import deque
+from operator import itemgetter
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 
 from src.core.rubric import load_rubric_from_file
 from src.core.assessment import get_assessment_data
 from src.core.grader import is_valid_assessment
 
+try:
+    import orjson  # Optional: much faster JSON parsing when installed
+except ImportError:
+    orjson = None
+
+# Name filters for the open/save file dialogs
+RUBRIC_FILE_FILTER = "Rubric Files (*.json *.csv);;JSON Files (*.json);;CSV Files (*.csv);;All Files (*)"
+JSON_FILE_FILTER = "JSON Files (*.json);;All Files (*)"
+
+
+# Characters str.isalnum() rejects: \w is the alphanumerics plus "_", and an
+# underscore is replaced by an underscore anyway
+_UNSAFE_FILENAME_CHARS = re.compile(r'\W')
+
+
+def sanitize_filename(name):
+    """
+    Replace every non-alphanumeric character with an underscore.
+
+    Args:
+        name (str): Text to use in a file name
+
+    Returns:
+        str: The sanitized text
+    """
+    return _UNSAFE_FILENAME_CHARS.sub('_', name)
+
+
+def read_json_file(file_path):
+    """
+    Read and parse a JSON file in one go, using orjson when available.
+
+    Args:
+        file_path (str): Path to the JSON file
+
+    Returns:
+        The parsed JSON data
+    """
+    with open(file_path, 'rb') as file:
+        raw = file.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def list_json_files(directory):
+    """
+    List the JSON files directly inside a directory.
+
+    Uses a single os.scandir pass instead of glob; like glob's "*.json",
+    hidden files are skipped.
+
+    Args:
+        directory (str): Directory to scan
+
+    Returns:
+        list: Paths of the JSON files, in directory order
+    """
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries
+                if entry.name.endswith('.json') and not entry.name.startswith('.')
+                and entry.is_file()]
+
+
+def dump_json_bytes(data, compact=False):
+    """
+    Serialize data to UTF-8 JSON bytes, using orjson when available.
+
+    Args:
+        data: JSON-serializable data
+        compact (bool): Skip indentation and whitespace, for files that are
+            only read back by the program (such as auto-saves)
+
+    Returns:
+        bytes: The encoded JSON document
+    """
+    if orjson is not None:
+        if compact:
+            return orjson.dumps(data)
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+# Read once at import (os.umask can only be queried by setting it), so
+# atomic writes create files with the same permissions as open() would
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_file_atomic(file_path, payload, fsync=False):
+    """
+    Write bytes to a file through a temporary file and an atomic rename.
+
+    A crash mid-write leaves the previous file intact instead of a
+    truncated one.
+
+    Args:
+        file_path (str): Destination path
+        payload (bytes): File contents
+        fsync (bool): Flush the data to disk before the rename; worth the
+            wait for user saves, not for auto-saves
+    """
+    # A unique temporary name, so concurrent writers to the same target
+    # never share one file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or '.',
+                                    prefix=os.path.basename(file_path) + '.',
+                                    suffix='.tmp')
+    try:
+        # mkstemp creates the file private; give it the usual permissions
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        with open(fd, 'wb') as file:
+            file.write(payload)
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _scan_auto_save_files(directory, prefix):
+    """Return (path, mtime) pairs for the auto-saves with the given prefix."""
+    # One scandir pass; the name filter runs before any stat call
+    with os.scandir(directory) as entries:
+        return [(entry.path, entry.stat().st_mtime) for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(".json")]
+
+
+def list_auto_save_files(directory, prefix):
+    """
+    List the auto-save files with the given prefix, oldest first.
+
+    Args:
+        directory (str): Auto-save directory
+        prefix (str): Filename prefix, e.g. "autosave_<student>_"
+
+    Returns:
+        list: Paths sorted by modification time
+    """
+    all_files = _scan_auto_save_files(directory, prefix)
+    all_files.sort(key=itemgetter(1))
+    return [path for path, _ in all_files]
+
+
+def prune_auto_save_files(directory, prefix, keep=5):
+    """
+    Remove old auto-save files with the given prefix, keeping the newest ones.
+
+    Args:
+        directory (str): Auto-save directory
+        prefix (str): Filename prefix, e.g. "autosave_<student>_"
+        keep (int): Number of most recent files to keep
+    """
+    try:
+        all_files = _scan_auto_save_files(directory, prefix)
+    except OSError:
+        return  # Silently fail - this is just cleanup
+
+    # Only the oldest surplus files are needed, not a full sort
+    excess = len(all_files) - keep
+    if excess <= 0:
+        return
+    for file_path, _ in heapq.nsmallest(excess, all_files, key=itemgetter(1)):
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+
+
+def track_auto_save(window, prefix, file_path, keep=5):
+    """
+    Record a new auto-save path and return the ones it pushes out.
+
+    The window remembers its recent auto-save paths (``_autosave_paths``) for
+    the current filename prefix, so each auto-save removes known files
+    instead of rescanning the directory. The directory is only scanned when
+    the prefix changes (a different student, or the first auto-save).
+
+    Args:
+        window: The window doing the auto-save
+        prefix (str): Filename prefix of the new auto-save
+        file_path (str): Path the new auto-save will be written to
+        keep (int): Number of most recent files to keep
+
+    Returns:
+        list: Paths of older auto-saves to delete once the write succeeds
+    """
+    paths = getattr(window, '_autosave_paths', None)
+    if paths is None or getattr(window, '_autosave_prefix', None) != prefix:
+        try:
+            paths = deque(list_auto_save_files(os.path.dirname(file_path), prefix))
+        except OSError:
+            paths = deque()
+        window._autosave_paths = paths
+        window._autosave_prefix = prefix
+    if not paths or paths[-1] != file_path:
+        paths.append(file_path)
+    return [paths.popleft() for _ in range(len(paths) - keep)]
+
+
+def forget_auto_saves(window):
+    """Make the next track_auto_save call rescan the auto-save directory."""
+    window._autosave_prefix = None
+
+
+def _file_dialog(window, name_filter):
+    """Return the window's file dialog, creating it on first use."""
+    dialog = getattr(window, '_file_dialog', None)
+    if dialog is None:
+        dialog = QFileDialog(window)
+        dialog._name_filter = None
+        window._file_dialog = dialog
+    # Only re-parse the filters when a different filter string is used
+    if dialog._name_filter != name_filter:
+        dialog.setNameFilter(name_filter)
+        dialog._name_filter = name_filter
+    return dialog
+
+
+def get_open_file_name(window, caption, name_filter):
+    """
+    Ask for an existing file with the window's reusable file dialog.
+
+    Unlike the static QFileDialog.getOpenFileName, the dialog is built once
+    per window, so later prompts skip its construction and start in the
+    last visited directory.
+
+    Args:
+        window: The parent window object
+        caption (str): Dialog title
+        name_filter (str): ";;"-separated file filters
+
+    Returns:
+        str: The chosen path, or "" if the dialog was cancelled
+    """
+    dialog = _file_dialog(window, name_filter)
+    dialog.setWindowTitle(caption)
+    dialog.setAcceptMode(QFileDialog.AcceptOpen)
+    dialog.setFileMode(QFileDialog.ExistingFile)
+    dialog.selectFile("")
+    if not dialog.exec_():
+        return ""
+    files = dialog.selectedFiles()
+    return files[0] if files else ""
+
+
+def get_save_file_name(window, caption, default_path, name_filter):
+    """
+    Ask for a file to save to with the window's reusable file dialog.
+
+    Args:
+        window: The parent window object
+        caption (str): Dialog title
+        default_path (str): Suggested file name or path
+        name_filter (str): ";;"-separated file filters
+
+    Returns:
+        str: The chosen path, or "" if the dialog was cancelled
+    """
+    dialog = _file_dialog(window, name_filter)
+    dialog.setWindowTitle(caption)
+    dialog.setAcceptMode(QFileDialog.AcceptSave)
+    dialog.setFileMode(QFileDialog.AnyFile)
+    dialog.selectFile(default_path)
+    if not dialog.exec_():
+        return ""
+    files = dialog.selectedFiles()
+    return files[0] if files else ""
+
+
+class AutoSaveSignals(QObject):
+    """Signals emitted by AutoSaveTask (QRunnable is not a QObject)."""
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class AutoSaveTask(QRunnable):
+    """
+    Write an already-serialized auto-save payload on a thread-pool thread.
+
+    The file is written to a temporary path and moved into place, then the
+    superseded auto-saves in ``stale_paths`` are removed.
+    """
+
+    def __init__(self, payload, file_path, stale_paths=()):
+        super().__init__()
+        self.payload = payload
+        self.file_path = file_path
+        self.stale_paths = stale_paths
+        self.signals = AutoSaveSignals()
+
+    def run(self):
+        try:
+            # Recreate the directory in case the temp dir was cleaned mid-session
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            write_file_atomic(self.file_path, self.payload)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        for stale_path in self.stale_paths:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass  # Already gone; this is just cleanup
+        self.signals.finished.emit(self.file_path)
+
+
+def _rubric_loaded_actions(window):
+    """
+    Return the UI updates to run after a rubric is loaded into a window.
+
+    Which of the optional widgets the window has is checked once; the
+    resulting callables (each taking the status message) are kept on the
+    window for later loads.
+    """
+    actions = getattr(window, '_rubric_loaded_actions', None)
+    if actions is None:
+        actions = []
+        if hasattr(window, 'setup_rubric_ui'):
+            actions.append(lambda message: window.setup_rubric_ui())
+        for name in ('export_btn', 'config_btn', 'analytics_btn'):
+            if hasattr(window, name):
+                button = getattr(window, name)
+                actions.append(lambda message, button=button: button.setEnabled(True))
+        if hasattr(window, 'status_bar'):
+            actions.append(window.status_bar.set_status)
+        if hasattr(window, 'status_label'):
+            actions.append(window.status_label.setText)
+        window._rubric_loaded_actions = actions
+    return actions
+
 
 def load_rubric(window, file_path=None, show_config_on_load=True):
     """
@@ -29,11 +373,10 @@ def load_rubric(window, file_path=None, show_config_on_load=True):
         bool: True if loaded successfully, False otherwise
     """
     if not file_path:
-        file_path, _ = QFileDialog.getOpenFileName(
+        file_path = get_open_file_name(
             window,
             "Open Rubric File",
-            "",
-            "Rubric Files (*.json *.csv);;JSON Files (*.json);;CSV Files (*.csv);;All Files (*)"
+            RUBRIC_FILE_FILTER
         )
 
     if not file_path:
@@ -48,23 +391,9 @@ def load_rubric(window, file_path=None, show_config_on_load=True):
         window.rubric_file_path = file_path
 
         # Update UI
-        if hasattr(window, 'setup_rubric_ui'):
-            window.setup_rubric_ui()
-
-        if hasattr(window, 'export_btn'):
-            window.export_btn.setEnabled(True)
-
-        if hasattr(window, 'config_btn'):
-            window.config_btn.setEnabled(True)
-
-        if hasattr(window, 'analytics_btn'):
-            window.analytics_btn.setEnabled(True)
-
-        if hasattr(window, 'status_bar'):
-            window.status_bar.set_status(f"Loaded rubric: {os.path.basename(file_path)}")
-
-        if hasattr(window, 'status_label'):
-            window.status_label.setText(f"Loaded rubric: {os.path.basename(file_path)}")
+        message = f"Loaded rubric: {os.path.basename(file_path)}"
+        for action in _rubric_loaded_actions(window):
+            action(message)
 
         # Only show grading config if the flag is True
         if show_config_on_load and hasattr(window, 'show_grading_config'):
@@ -104,15 +433,15 @@ def save_assessment(window):
         student = window.student_name_edit.text()
         assignment = window.assignment_name_edit.text()
         if student and assignment:
-            safe_student = ''.join(c if c.isalnum() else '_' for c in student)
-            safe_assignment = ''.join(c if c.isalnum() else '_' for c in assignment)
+            safe_student = sanitize_filename(student)
+            safe_assignment = sanitize_filename(assignment)
             default_path = f"{safe_assignment}_{safe_student}.json"
 
-    file_path, _ = QFileDialog.getSaveFileName(
+    file_path = get_save_file_name(
         window,
         "Save Assessment",
         default_path,
-        "JSON Files (*.json);;All Files (*)"
+        JSON_FILE_FILTER
     )
 
     if not file_path:
@@ -123,8 +452,7 @@ def save_assessment(window):
         file_path += '.json'
 
     try:
-        with open(file_path, 'w') as file:
-            json.dump(assessment_data, file, indent=2)
+        write_file_atomic(file_path, dump_json_bytes(assessment_data), fsync=True)
 
         # Update current assessment path
         window.current_assessment_path = file_path
@@ -151,19 +479,17 @@ def load_assessment(window):
     Returns:
         bool: True if loaded successfully, False otherwise
     """
-    file_path, _ = QFileDialog.getOpenFileName(
+    file_path = get_open_file_name(
         window,
         "Open Assessment File",
-        "",
-        "JSON Files (*.json);;All Files (*)"
+        JSON_FILE_FILTER
     )
 
     if not file_path:
         return False
 
     try:
-        with open(file_path, 'r') as file:
-            assessment_data = json.load(file)
+        assessment_data = read_json_file(file_path)
 
         # Validate the assessment data
         if not is_valid_assessment(assessment_data):
@@ -273,33 +599,58 @@ def auto_save_assessment(window):
     if not window.rubric_data or not window.criterion_widgets:
         return
 
+    # Windows that flag edits through mark_dirty() skip the whole gather
+    # while nothing has changed since the last auto-save
+    if not getattr(window, '_dirty', True):
+        return
+
     # Get assessment data without validation
     assessment_data = get_assessment_data(window, validate=False)
     if not assessment_data:
         return
+    if hasattr(window, '_dirty'):
+        window._dirty = False
 
     # Create a unique filename based on student name and timestamp
     student_name = window.student_name_edit.text() or "unnamed_student"
-    student_name = ''.join(c if c.isalnum() else '_' for c in student_name)  # Sanitize filename
+    student_name = sanitize_filename(student_name)
     timestamp = int(time.time())
-    filename = f"autosave_{student_name}_{timestamp}.json"
-    file_path = os.path.join(window.auto_save_dir, filename)
+    prefix = f"autosave_{student_name}_"
+    file_path = os.path.join(window.auto_save_dir, f"{prefix}{timestamp}.json")
 
-    try:
-        with open(file_path, 'w') as file:
-            json.dump(assessment_data, file, indent=2)
-
-        # Update status bar
+    def report_saved(_path):
         if hasattr(window, 'status_bar'):
             current_time = time.strftime("%H:%M:%S")
             window.status_bar.set_auto_save_status(f"Saved at {current_time}")
             window.status_bar.show_temporary_message("Assessment auto-saved")
 
-        # Clean up old auto-save files (keep only the 5 most recent)
-        cleanup_auto_save_files(window)
-    except Exception as e:
+    def report_failed(message):
+        window._last_autosave_digest = None  # Retry on the next tick
+        forget_auto_saves(window)  # Nothing was removed; rescan next time
+        if hasattr(window, '_dirty'):
+            window._dirty = True
         if hasattr(window, 'status_bar'):
-            window.status_bar.set_auto_save_status(f"Failed: {str(e)}", is_error=True)
+            window.status_bar.set_auto_save_status(f"Failed: {message}", is_error=True)
+
+    # Serialize here, where the form state is consistent, then write the file
+    # (and remove old auto-saves, keeping the 5 most recent) on a pool thread
+    try:
+        payload = dump_json_bytes(assessment_data, compact=True)
+    except Exception as e:
+        report_failed(str(e))
+        return
+
+    # Nothing changed since the last auto-save: no new file, no cleanup
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    if digest == getattr(window, '_last_autosave_digest', None):
+        return
+    window._last_autosave_digest = digest
+
+    stale_paths = track_auto_save(window, prefix, file_path)
+    task = AutoSaveTask(payload, file_path, stale_paths)
+    task.signals.finished.connect(report_saved)
+    task.signals.failed.connect(report_failed)
+    QThreadPool.globalInstance().start(task)
 
 
 def cleanup_auto_save_files(window):
@@ -309,23 +660,7 @@ def cleanup_auto_save_files(window):
     Args:
         window: The parent window object
     """
-    try:
-        # Get all auto-save files for the current student
-        student_name = window.student_name_edit.text() or "unnamed_student"
-        student_name = ''.join(c if c.isalnum() else '_' for c in student_name)
-
-        all_files = []
-        for filename in os.listdir(window.auto_save_dir):
-            if filename.startswith(f"autosave_{student_name}_") and filename.endswith(".json"):
-                file_path = os.path.join(window.auto_save_dir, filename)
-                all_files.append((file_path, os.path.getmtime(file_path)))
-
-        # Sort by modification time (newest first)
-        all_files.sort(key=lambda x: x[1], reverse=True)
-
-        # Keep only the 5 most recent files
-        for file_path, _ in all_files[5:]:
-            os.remove(file_path)
-    except Exception:
-        # Silently fail - this is just cleanup
-        pass
\ No newline at end of file
+    # Get all auto-save files for the current student
+    student_name = window.student_name_edit.text() or "unnamed_student"
+    student_name = sanitize_filename(student_name)
+    prune_auto_save_files(window.auto_save_dir, f"autosave_{student_name}_")
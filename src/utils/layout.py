@@ -5,7 +5,7 @@ This module provides functions for managing UI layouts, including setting up
 UI components based on loaded data and handling layout-specific operations.
 """
 
-from PyQt5.QtWidgets import QLabel, QHBoxLayout, QPushButton, QCheckBox
+from PyQt5.QtWidgets import QLabel, QHBoxLayout, QPushButton, QCheckBox, QWidget
 from src.core.assessment import update_question_summary
 
 
@@ -16,73 +16,151 @@ def setup_rubric_ui(window):
     Args:
         window: The parent window object
     """
-    # Clear existing criteria
-    clear_layout(window.criteria_layout)
-    window.criterion_widgets = []
-    window.question_groups = {}
-    window.question_summary_card.setVisible(True)
-
-    if not window.rubric_data or "criteria" not in window.rubric_data:
-        window.status_bar.set_status("Invalid rubric format.")
-        window.status_label.setText("Invalid rubric format.")
-        return
-
-    # Set assignment name if available
-    if "title" in window.rubric_data and not window.assignment_name_edit.text():
-        window.assignment_name_edit.setText(window.rubric_data["title"])
+    # Freeze the window and hide the criteria container while it is rebuilt,
+    # so the new criteria, question checkboxes, totals and summary are laid
+    # out and painted once
+    window.setUpdatesEnabled(False)
+    try:
+        if not _rebuild_criteria(window):
+            return
 
-    # Extract main questions from criteria titles
-    from src.core.grader import extract_main_questions
-    main_questions = extract_main_questions(window)
+        # Set up question selection UI (update_total_points rebuilds the summary)
+        setup_question_selection(window, update_summary=False)
 
-    # Create widgets for each criterion
-    from src.ui.widgets import CriterionWidget
-    from src.core.utils import extract_question_number
+        # Update config info with question count
+        window.update_config_info()
 
-    for criterion in window.rubric_data["criteria"]:
-        criterion_widget = CriterionWidget(criterion)
-        # Connect the signal to update total points when a criterion changes
-        criterion_widget.points_changed.connect(window.on_criterion_points_changed)
-        window.criteria_layout.addWidget(criterion_widget)
-        window.criterion_widgets.append(criterion_widget)
+        # Update total points and, with them, the question summary
+        from src.core.assessment import update_total_points
+        update_total_points(window)
+    finally:
+        window.setUpdatesEnabled(True)
 
-        # Group by main question
-        title = criterion["title"]
-        main_question = extract_question_number(title)
 
-        if main_question:
-            if main_question not in window.question_groups:
-                window.question_groups[main_question] = []
+def _rebuild_criteria(window):
+    """
+    Replace the criterion widgets with ones for the loaded rubric.
 
-            window.question_groups[main_question].append(criterion_widget)
+    Existing widgets are reused by position: one whose criterion is
+    unchanged (typically when the same rubric is loaded again) is just
+    reset, the others are rebound to their new criterion. Widgets left over
+    when the new rubric is shorter are hidden and kept as spares, and new
+    widgets are only created beyond the pool. An invalid rubric hides the
+    whole pool so the next load can still reuse it.
 
-    # Set up question selection UI
-    setup_question_selection(window)
+    Returns:
+        bool: False if the rubric has no criteria list
+    """
+    criteria = window.rubric_data.get("criteria") if window.rubric_data else None
+    pool = window.criterion_widgets + getattr(window, '_spare_criterion_widgets', [])
+
+    container = window.criteria_layout.parentWidget()
+    container.setUpdatesEnabled(False)
+    container.setVisible(False)
+    try:
+        # Clear existing criteria, keeping the pooled widgets alive
+        clear_layout(window.criteria_layout, keep=pool)
+        window.criterion_widgets = []
+        window._spare_criterion_widgets = pool[len(criteria or ()):]
+        for spare in window._spare_criterion_widgets:
+            spare.setVisible(False)
+        window.question_groups = {}
+        window.question_summary_card.setVisible(True)
+
+        if criteria is None:
+            window.status_bar.set_status("Invalid rubric format.")
+            window.status_label.setText("Invalid rubric format.")
+            return False
+
+        # Set assignment name if available
+        if "title" in window.rubric_data and not window.assignment_name_edit.text():
+            window.assignment_name_edit.setText(window.rubric_data["title"])
+
+        # Create widgets for each criterion
+        from src.ui.widgets import CriterionWidget
+
+        for index, (criterion, main_question) in enumerate(_parse_criteria(window)):
+            if index < len(pool):
+                # Already connected; just start it from a clean state
+                criterion_widget = pool[index]
+                criterion_widget.blockSignals(True)
+                if criterion_widget.criterion_data == criterion:
+                    criterion_widget.criterion_data = criterion
+                    criterion_widget.reset()
+                else:
+                    criterion_widget.rebind(criterion)
+                criterion_widget.blockSignals(False)
+                if criterion_widget.isHidden():
+                    criterion_widget.setVisible(True)
+            else:
+                criterion_widget = CriterionWidget(criterion)
+                # Connect the signal to update total points when a criterion changes
+                criterion_widget.points_changed.connect(window.on_criterion_points_changed)
+                # Comment edits don't change points but still need auto-saving
+                if hasattr(window, 'mark_dirty'):
+                    criterion_widget.comments_edit.textChanged.connect(window.mark_dirty)
+            window.criterion_widgets.append(criterion_widget)
+
+            # Group by main question
+            if main_question:
+                if main_question not in window.question_groups:
+                    window.question_groups[main_question] = []
+
+                window.question_groups[main_question].append(criterion_widget)
+
+        # Add the finished widgets in one pass, then the stretch to push
+        # everything up
+        for criterion_widget in window.criterion_widgets:
+            window.criteria_layout.addWidget(criterion_widget)
+        window.criteria_layout.addStretch()
+        return True
+    finally:
+        container.setVisible(True)
+        container.setUpdatesEnabled(True)
+
+
+def _parse_criteria(window):
+    """
+    Pair each rubric criterion with the main question its title belongs to.
 
-    # Add stretch to push everything up
-    window.criteria_layout.addStretch()
+    Titles are parsed once per loaded rubric; the result is cached on the
+    window until rubric_data is replaced.
 
-    # Update total points
-    from src.core.assessment import update_total_points
-    update_total_points(window)
+    Args:
+        window: The parent window object
 
-    # Update config info with question count
-    window.update_config_info()
+    Returns:
+        list: (criterion, main question or None) tuples in rubric order
+    """
+    criteria = window.rubric_data["criteria"]
+    cached = getattr(window, '_parsed_criteria', None)
+    # Holding the list itself keeps its id from being reused
+    if cached is not None and cached[0] is criteria:
+        return cached[1]
 
-    # Update the question summary
-    from src.core.assessment import update_question_summary
-    update_question_summary(window)
+    from src.core.utils import extract_question_number
+    parsed = [(criterion, extract_question_number(criterion["title"]))
+              for criterion in criteria]
+    window._parsed_criteria = (criteria, parsed)
+    return parsed
 
 
-def setup_question_selection(window):
+def setup_question_selection(window, update_summary=True):
     """
     Set up checkboxes for selecting which questions the student attempted.
 
     Args:
         window: The parent window object
+        update_summary (bool): Rebuild the question summary afterwards; pass
+            False when the caller rebuilds it itself
     """
-    # Clear existing checkboxes
-    clear_layout(window.question_selection_layout)
+    # Drop the previous panel in one piece; deleting it takes its label,
+    # checkboxes and buttons with it
+    old_panel = getattr(window, '_question_selection_panel', None)
+    if old_panel is not None:
+        window.question_selection_layout.removeWidget(old_panel)
+        old_panel.deleteLater()
+        window._question_selection_panel = None
 
     grading_mode = window.grading_config["grading_mode"]
     questions_to_count = window.grading_config["questions_to_count"]
@@ -92,6 +170,12 @@ def setup_question_selection(window):
         window.question_selection_group.setVisible(True)
         window.question_checkboxes = {}
 
+        # Everything is built into a fresh panel that is added to the group
+        # once at the end
+        panel = QWidget()
+        panel_layout = QHBoxLayout(panel)
+        panel_layout.setContentsMargins(0, 0, 0, 0)
+
         # Helper text based on grading mode
         if grading_mode == "best_scores":
             helper_text = "Select ALL questions the student attempted:"
@@ -99,8 +183,8 @@ def setup_question_selection(window):
             helper_text = f"Select the {questions_to_count} questions to grade:"
 
         helper_label = QLabel(helper_text)
-        helper_label.setStyleSheet("font-weight: bold; margin-bottom: 8px;")
-        window.question_selection_layout.addWidget(helper_label)
+        helper_label.setObjectName("questionSelectionHint")  # Styled by MAIN_WINDOW_QSS
+        panel_layout.addWidget(helper_label)
 
         # Create a grid layout for checkboxes
         checkbox_layout = QHBoxLayout()
@@ -109,58 +193,41 @@ def setup_question_selection(window):
         for q in sorted(window.question_groups.keys()):
             checkbox = QCheckBox(f"Question {q}")
             checkbox.setChecked(True)  # Default to checked
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    font-size: 12px;
-                    padding: 4px;
-                }
-                QCheckBox:hover {
-                    background-color: #F5F5F5;
-                    border-radius: 4px;
-                }
-            """)
-            checkbox.stateChanged.connect(window.on_question_selection_changed)
+            checkbox.setObjectName("questionCheckBox")
+            # clicked only fires for the user's own toggles; code that calls
+            # setChecked recomputes the totals itself
+            checkbox.clicked.connect(window.on_question_selection_changed)
             checkbox_layout.addWidget(checkbox)
             window.question_checkboxes[q] = checkbox
 
         checkbox_layout.addStretch()
-        window.question_selection_layout.addLayout(checkbox_layout)
+        panel_layout.addLayout(checkbox_layout)
 
         # Add select all/none buttons
         buttons_layout = QHBoxLayout()
         buttons_layout.addStretch()
 
         select_all_btn = QPushButton("Select All")
-        select_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #3F51B5;
-                border: 1px solid #3F51B5;
-                min-width: 100px;
-            }
-        """)
+        select_all_btn.setObjectName("selectAllButton")
         select_all_btn.clicked.connect(lambda: select_all_questions(window))
         buttons_layout.addWidget(select_all_btn)
 
         select_none_btn = QPushButton("Select None")
-        select_none_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #757575;
-                border: 1px solid #BDBDBD;
-                min-width: 100px;
-            }
-        """)
+        select_none_btn.setObjectName("selectNoneButton")
         select_none_btn.clicked.connect(lambda: select_no_questions(window))
         buttons_layout.addWidget(select_none_btn)
 
-        window.question_selection_layout.addLayout(buttons_layout)
+        panel_layout.addLayout(buttons_layout)
+
+        window.question_selection_layout.addWidget(panel)
+        window._question_selection_panel = panel
 
     else:
         window.question_selection_group.setVisible(False)
 
     # Update the question summary display
-    update_question_summary(window)
+    if update_summary:
+        update_question_summary(window)
 
 
 def select_all_questions(window):
@@ -170,9 +237,7 @@ def select_all_questions(window):
     Args:
         window: The parent window object
     """
-    if hasattr(window, 'question_checkboxes'):
-        for checkbox in window.question_checkboxes.values():
-            checkbox.setChecked(True)
+    _set_all_questions(window, True)
 
 
 def select_no_questions(window):
@@ -182,23 +247,46 @@ def select_no_questions(window):
     Args:
         window: The parent window object
     """
-    if hasattr(window, 'question_checkboxes'):
-        for checkbox in window.question_checkboxes.values():
-            checkbox.setChecked(False)
+    _set_all_questions(window, False)
+
 
+def _set_all_questions(window, checked):
+    """Check or uncheck every question, recomputing the totals only once."""
+    checkboxes = [checkbox for checkbox in getattr(window, 'question_checkboxes', {}).values()
+                  if checkbox.isChecked() != checked]
+    if not checkboxes:
+        return
+
+    # setChecked doesn't emit clicked, so nothing fires until the one
+    # notification below
+    for checkbox in checkboxes:
+        checkbox.setChecked(checked)
+    window.on_question_selection_changed()
 
-def clear_layout(layout):
+
+def clear_layout(layout, keep=()):
     """
-    Clear all widgets from a layout.
+    Clear all widgets from a layout, including those in nested layouts.
+
+    Nested layouts are emptied from an explicit stack rather than by
+    recursion, and items are taken from the end so no list entries shift.
 
     Args:
         layout: The layout to clear
+        keep (iterable, optional): Widgets to take out of the layout without
+            deleting them, so they can be added again
     """
-    while layout.count():
-        item = layout.takeAt(0)
-        widget = item.widget()
-
-        if widget:
-            widget.deleteLater()
-        elif item.layout():
-            clear_layout(item.layout())
\ No newline at end of file
+    keep = set(keep)
+    pending = [layout]
+    while pending:
+        current = pending.pop()
+        while current.count():
+            item = current.takeAt(current.count() - 1)
+            widget = item.widget()
+
+            if widget in keep:
+                continue
+            if widget:
+                widget.deleteLater()
+            elif item.layout():
+                pending.append(item.layout())
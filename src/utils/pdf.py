@@ -6,13 +6,49 @@ including single assessments and batch exports.
 """
 
 import os
-import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
-from PyQt5.QtWidgets import QFileDialog, QMessageBox, QProgressDialog
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QFileDialog, QMessageBox, QProgressDialog
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal
 
 from src.core.assessment import get_assessment_data
-from src.utils.pdf_generator import generate_assessment_pdf
+from src.utils.file_io import dump_json_bytes, read_json_file, sanitize_filename
+
+# Upper bound on the worker threads rendering a batch export
+_EXPORT_MAX_WORKERS = os.cpu_count() or 1
+
+
+class PdfExportWorker(QObject):
+    """
+    Worker that renders one assessment PDF off the GUI thread.
+
+    Move it to a QThread and start ``run`` from the thread's ``started``
+    signal; exactly one of ``finished`` (file path) or ``failed`` (error
+    message) is emitted.
+    """
+
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_path, assessment_data):
+        super().__init__()
+        self.file_path = file_path
+        self.assessment_data = assessment_data
+
+    def run(self):
+        """Build the PDF and report the outcome."""
+        try:
+            from src.utils.pdf_generator import generate_assessment_pdf
+            ok = generate_assessment_pdf(self.file_path, self.assessment_data)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        if ok is False:
+            # generate_assessment_pdf reports its own errors and returns False
+            self.failed.emit("The PDF could not be generated.")
+        else:
+            self.finished.emit(self.file_path)
 
 
 def export_to_pdf(window):
@@ -35,31 +71,118 @@ def export_to_pdf(window):
     student = window.student_name_edit.text()
     assignment = window.assignment_name_edit.text()
     if student and assignment:
-        safe_student = ''.join(c if c.isalnum() else '_' for c in student)
-        safe_assignment = ''.join(c if c.isalnum() else '_' for c in assignment)
+        safe_student = sanitize_filename(student)
+        safe_assignment = sanitize_filename(assignment)
         default_name = f"{safe_assignment}_{safe_student}.pdf"
 
+    # Start in the last export directory so the dialog has nothing to guess
     file_path, _ = QFileDialog.getSaveFileName(
         window,
         "Export to PDF",
-        default_name,
+        os.path.join(window._last_export_dir, default_name),
         "PDF Files (*.pdf);;All Files (*)"
     )
 
     if not file_path:
         return
+    window._last_export_dir = os.path.dirname(file_path)
 
     # Ensure .pdf extension
     if not file_path.lower().endswith('.pdf'):
         file_path += '.pdf'
 
-    try:
-        generate_assessment_pdf(file_path, assessment_data)
+    # Render on a worker thread so the window keeps painting meanwhile
+    thread = QThread()
+    worker = PdfExportWorker(file_path, assessment_data)
+    worker.moveToThread(thread)
+
+    def report_exported(path):
         if hasattr(window, 'status_bar'):
             window.status_bar.show_temporary_message("PDF exported successfully")
         QMessageBox.information(window, "Success", "Assessment exported to PDF successfully.")
-    except Exception as e:
-        QMessageBox.critical(window, "Error", f"Failed to export to PDF: {str(e)}")
+
+    def report_failed(message):
+        if hasattr(window, 'status_bar'):
+            window.status_bar.show_temporary_message("PDF export failed")
+        QMessageBox.critical(window, "Error", f"Failed to export to PDF: {message}")
+
+    def cleanup():
+        window._pdf_exports.discard((thread, worker))
+        worker.deleteLater()
+        thread.deleteLater()
+
+    thread.started.connect(worker.run)
+    worker.finished.connect(thread.quit, Qt.DirectConnection)
+    worker.failed.connect(thread.quit, Qt.DirectConnection)
+    worker.finished.connect(report_exported, Qt.QueuedConnection)
+    worker.failed.connect(report_failed, Qt.QueuedConnection)
+    thread.finished.connect(cleanup)
+
+    # Keep the pair alive until the thread is done
+    if not hasattr(window, '_pdf_exports'):
+        window._pdf_exports = set()
+    window._pdf_exports.add((thread, worker))
+
+    # Shown until the result message replaces it (which also restores the
+    # previous status afterwards)
+    if hasattr(window, 'status_bar'):
+        window.status_bar.show_temporary_message(
+            f"Exporting {os.path.basename(file_path)}...", duration=60000)
+    thread.start()
+
+
+def _export_one(file_path, assessment, output_base):
+    """
+    Copy one assessment next to its rendered PDF.
+
+    Runs on a batch export worker thread.
+
+    Args:
+        file_path (str): Path to the assessment JSON file
+        assessment (dict): The parsed assessment
+        output_base (str): Output path without extension, shared by the
+            JSON copy and the PDF
+
+    Returns:
+        bool: True if the PDF was generated
+    """
+    # Save JSON (a byte copy; the data itself is unchanged)
+    output_json = output_base + ".json"
+    shutil.copyfile(file_path, output_json)
+
+    # Generate PDF
+    output_pdf = output_base + ".pdf"
+    try:
+        from src.utils.pdf_generator import generate_assessment_pdf
+        # generate_assessment_pdf reports its own errors and returns False
+        return generate_assessment_pdf(output_pdf, assessment) is not False
+    except Exception as pdf_error:
+        print(f"PDF generation failed: {str(pdf_error)}")
+        return False
+
+
+def _unique_stem(stem, used):
+    """
+    Return stem, or stem with a counter appended if it is already taken.
+
+    Exports run concurrently, so two files sharing an output name would be
+    written by two processes at once. Names are compared case-insensitively
+    to match case-insensitive file systems.
+
+    Args:
+        stem (str): Sanitized file name without extension
+        used (set): Lower-cased stems already assigned; updated in place
+
+    Returns:
+        str: A stem not in used
+    """
+    candidate = stem
+    counter = 2
+    while candidate.lower() in used:
+        candidate = f"{stem}_{counter}"
+        counter += 1
+    used.add(candidate.lower())
+    return candidate
 
 
 def batch_export_assessments(window):
@@ -74,12 +197,13 @@ def batch_export_assessments(window):
     export_dir = QFileDialog.getExistingDirectory(
         window,
         "Select Export Directory",
-        "",
+        window._last_export_dir,
         QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
     )
 
     if not export_dir:
         return
+    window._last_export_dir = export_dir
 
     # Create a dialog to get a list of assessment files
     file_dialog = QFileDialog(window)
@@ -100,8 +224,7 @@ def batch_export_assessments(window):
     batch_dir = os.path.join(export_dir, f"batch_{timestamp}")
 
     try:
-        if not os.path.exists(batch_dir):
-            os.makedirs(batch_dir)
+        os.makedirs(batch_dir, exist_ok=True)
     except Exception as e:
         QMessageBox.critical(
             window,
@@ -116,49 +239,58 @@ def batch_export_assessments(window):
     progress.setWindowModality(Qt.WindowModal)
 
     exported_count = 0
+    done_count = 0
 
-    for i, file_path in enumerate(selected_files):
-        progress.setValue(i)
-        if progress.wasCanceled():
-            break
-
+    # Parse each assessment here so every output gets its own file name
+    # before any worker starts writing
+    jobs = []
+    used_stems = set()
+    for file_path in selected_files:
         try:
-            with open(file_path, 'r') as file:
-                assessment = json.load(file)
-
-            # Generate a filename for the output
-            student_name = assessment.get("student_name", "unnamed")
-            safe_student = ''.join(c if c.isalnum() else '_' for c in student_name)
-
-            # Save JSON
-            output_json = os.path.join(batch_dir, f"{safe_student}.json")
-            with open(output_json, 'w') as file:
-                json.dump(assessment, file, indent=2)
-
-            # Generate PDF
-            output_pdf = os.path.join(batch_dir, f"{safe_student}.pdf")
-            try:
-                generate_assessment_pdf(output_pdf, assessment)
-            except Exception as pdf_error:
-                print(f"PDF generation failed: {str(pdf_error)}")
-
-            exported_count += 1
-
+            assessment = read_json_file(file_path)
         except Exception as e:
             print(f"Error processing {file_path}: {str(e)}")
+            done_count += 1
+            continue
+        stem = _unique_stem(sanitize_filename(assessment.get("student_name", "unnamed")), used_stems)
+        jobs.append((file_path, assessment, os.path.join(batch_dir, stem)))
+
+    # Render on worker threads; this thread only collects results and
+    # keeps the progress dialog (and its Cancel button) responsive
+    executor = ThreadPoolExecutor(max_workers=max(1, min(_EXPORT_MAX_WORKERS, len(jobs))))
+    futures = {executor.submit(_export_one, *job): job[0] for job in jobs}
+    pending = set(futures)
+    progress.setValue(done_count)
+
+    while pending and not progress.wasCanceled():
+        done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                if future.result():
+                    exported_count += 1
+            except Exception as e:
+                print(f"Error processing {futures[future]}: {str(e)}")
+        done_count += len(done)
+        progress.setValue(done_count)
+        QApplication.processEvents()
+
+    # Files not yet started are dropped if the export was canceled
+    for future in pending:
+        future.cancel()
+    executor.shutdown(wait=True)
 
     progress.setValue(len(selected_files))
 
     # Create batch summary file
     try:
         summary_path = os.path.join(batch_dir, "batch_info.json")
-        with open(summary_path, 'w') as file:
-            summary = {
-                "export_date": timestamp,
-                "file_count": exported_count,
-                "assignment_name": window.assignment_name_edit.text() or "Unknown Assignment"
-            }
-            json.dump(summary, file, indent=2)
+        summary = {
+            "export_date": timestamp,
+            "file_count": exported_count,
+            "assignment_name": window.assignment_name_edit.text() or "Unknown Assignment"
+        }
+        with open(summary_path, 'wb') as file:
+            file.write(dump_json_bytes(summary))
     except Exception as e:
         print(f"Failed to create batch summary: {str(e)}")
 
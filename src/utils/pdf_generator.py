@@ -1,139 +1,259 @@
 # utils/pdf_generator.py
 # Replace your existing src/utils/pdf_generator.py with this version
 
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
+
 from src.core.grader import extract_question_number
 import html as html_module
 
+try:
+    # Optional: only needed to render PDFs (this module is imported lazily)
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table,
+                                    TableStyle, KeepTogether)
+    _HAS_REPORTLAB = True
+except ImportError:
+    _HAS_REPORTLAB = False
 
-def get_letter_grade(percentage):
-    """Return a letter grade based on percentage."""
-    if percentage >= 90:
-        return "A"
-    elif percentage >= 80:
-        return "B"
-    elif percentage >= 70:
-        return "C"
-    elif percentage >= 60:
-        return "D"
-    else:
-        return "F"
+
+# Lower bound (inclusive) of each letter grade above F, ascending
+_GRADE_CUTOFFS = (60, 70, 80, 90)
+_LETTER_GRADES = ("F", "D", "C", "B", "A")
 
 
+def get_letter_grade(percentage):
+    """Return a letter grade based on percentage."""
+    return _LETTER_GRADES[bisect_right(_GRADE_CUTOFFS, percentage)]
+
+
+# Common LaTeX commands and their Unicode symbols, applied in this order; a
+# command comes before any shorter command that is a prefix of it
+_LATEX_REPLACEMENTS = (
+    ('\\sum', 'Σ'),
+    ('\\Sigma', 'Σ'),
+    ('\\prod', 'Π'),
+    ('\\int', '∫'),
+    ('\\alpha', 'α'),
+    ('\\beta', 'β'),
+    ('\\gamma', 'γ'),
+    ('\\delta', 'δ'),
+    ('\\theta', 'θ'),
+    ('\\Theta', 'Θ'),
+    ('\\lambda', 'λ'),
+    ('\\mu', 'μ'),
+    ('\\pi', 'π'),
+    ('\\Pi', 'Π'),
+    ('\\infty', '∞'),
+    ('\\leq', '≤'),
+    ('\\geq', '≥'),
+    ('\\neq', '≠'),
+    ('\\approx', '≈'),
+    ('\\times', '×'),
+    ('\\div', '÷'),
+    ('\\sqrt', '√'),
+    ('\\in', '∈'),
+    ('\\notin', '∉'),
+    ('\\subseteq', '⊆'),
+    ('\\subset', '⊂'),
+    ('\\cup', '∪'),
+    ('\\cap', '∩'),
+    ('\\emptyset', '∅'),
+    ('\\forall', '∀'),
+    ('\\exists', '∃'),
+    ('\\partial', '∂'),
+    ('\\nabla', '∇'),
+)
+
+
+@lru_cache(maxsize=4096)
 def clean_text_for_pdf(text):
-    """Clean text to remove LaTeX and problematic characters."""
+    """
+    Clean text to remove LaTeX and problematic characters.
+
+    Cached because the same rubric titles and level descriptions are
+    cleaned for every student in a batch export.
+    """
     if not text:
         return ""
 
-    # Replace common LaTeX commands with Unicode symbols
-    replacements = {
-        '\\sum': 'Σ',
-        '\\Sigma': 'Σ',
-        '\\prod': 'Π',
-        '\\int': '∫',
-        '\\alpha': 'α',
-        '\\beta': 'β',
-        '\\gamma': 'γ',
-        '\\delta': 'δ',
-        '\\theta': 'θ',
-        '\\Theta': 'Θ',
-        '\\lambda': 'λ',
-        '\\mu': 'μ',
-        '\\pi': 'π',
-        '\\Pi': 'Π',
-        '\\infty': '∞',
-        '\\leq': '≤',
-        '\\geq': '≥',
-        '\\neq': '≠',
-        '\\approx': '≈',
-        '\\times': '×',
-        '\\div': '÷',
-        '\\sqrt': '√',
-        '\\in': '∈',
-        '\\notin': '∉',
-        '\\subset': '⊂',
-        '\\subseteq': '⊆',
-        '\\cup': '∪',
-        '\\cap': '∩',
-        '\\emptyset': '∅',
-        '\\forall': '∀',
-        '\\exists': '∃',
-        '\\partial': '∂',
-        '\\nabla': '∇',
-    }
+    # Every LaTeX command starts with a backslash, so plain text skips them
+    if '\\' in text:
+        for latex, unicode_char in _LATEX_REPLACEMENTS:
+            text = text.replace(latex, unicode_char)
 
-    for latex, unicode_char in replacements.items():
-        text = text.replace(latex, unicode_char)
+        # Remove any remaining backslashes
+        text = text.replace('\\', '')
 
     # Remove dollar signs (math mode delimiters)
     text = text.replace('$', '')
 
-    # Remove any remaining backslashes
-    text = text.replace('\\', '')
-
     # Escape HTML special characters
     text = html_module.escape(text)
 
     return text
 
 
-def generate_assessment_pdf(file_path, assessment_data):
-    """Generate a PDF report of the assessment with table-formatted achievement levels."""
-    try:
-        # Import reportlab for PDF generation
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib import colors
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, KeepTogether
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.lib.enums import TA_LEFT, TA_CENTER
+@lru_cache(maxsize=None)
+def _pdf_styles():
+    """
+    Build the paragraph and table styles used by generate_assessment_pdf, once.
 
-        # Create the PDF document with margins
-        doc = SimpleDocTemplate(
-            file_path,
-            pagesize=letter,
-            leftMargin=0.75 * inch,
-            rightMargin=0.75 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch
-        )
-        styles = getSampleStyleSheet()
+    The styles are never modified after creation, so every report (and
+    every criterion within it) shares the same instances.
 
-        # Create custom styles
-        title_style = ParagraphStyle(
+    Returns:
+        dict: ParagraphStyle, TableStyle and color objects keyed by role
+    """
+    sample = getSampleStyleSheet()
+    normal_style = sample['Normal']
+    return {
+        'title': ParagraphStyle(
             'Title',
-            parent=styles['Heading1'],
+            parent=sample['Heading1'],
             fontSize=18,
             alignment=TA_CENTER,
             spaceAfter=12,
             textColor=colors.HexColor('#2C3E50')
-        )
-
-        heading_style = ParagraphStyle(
+        ),
+        'heading': ParagraphStyle(
             'Heading',
-            parent=styles['Heading2'],
+            parent=sample['Heading2'],
             fontSize=14,
             spaceAfter=8,
             spaceBefore=12,
             textColor=colors.HexColor('#34495E')
-        )
-
-        subheading_style = ParagraphStyle(
+        ),
+        'subheading': ParagraphStyle(
             'Subheading',
-            parent=styles['Heading3'],
+            parent=sample['Heading3'],
             fontSize=12,
             spaceAfter=6,
             spaceBefore=10,
             textColor=colors.HexColor('#2C3E50'),
             fontName='Helvetica-Bold'
-        )
-
-        normal_style = styles['Normal']
-
-        small_style = ParagraphStyle(
+        ),
+        'normal': normal_style,
+        'small': ParagraphStyle(
             'Small',
-            parent=styles['Normal'],
+            parent=normal_style,
             fontSize=9
+        ),
+        'criterion_description': ParagraphStyle(
+            'CriterionDesc',
+            parent=normal_style,
+            fontSize=10,
+            textColor=colors.HexColor('#7F8C8D'),
+            leftIndent=10
+        ),
+        'comments': ParagraphStyle(
+            'Comments',
+            parent=normal_style,
+            fontSize=10,
+            leftIndent=10,
+            rightIndent=10,
+            spaceBefore=4,
+            spaceAfter=4,
+            textColor=colors.HexColor('#2C3E50')
+        ),
+        # Table styles shared by every report
+        'summary_table': TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ECF0F1')),
+            ('BACKGROUND', (1, 0), (1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 11),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('PADDING', (0, 0), (-1, -1), 8),
+        ]),
+        'question_summary_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.white),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+            ('TOPPADDING', (0, 0), (-1, 0), 10),
+            ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#34495E')),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#BDC3C7')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F8F9FA')]),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('PADDING', (0, 1), (-1, -1), 6),
+        ]),
+        # Table styles repeated for every criterion
+        'score_box': TableStyle([
+            ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#ECF0F1')),
+            ('BACKGROUND', (1, 0), (1, 0), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
+            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+            ('ALIGN', (1, 0), (1, 0), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('PADDING', (0, 0), (-1, -1), 6),
+        ]),
+        'comments_box': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#FEF9E7')),
+            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#F39C12')),
+            ('PADDING', (0, 0), (-1, -1), 10),
+        ]),
+        'separator': TableStyle([
+            ('LINEABOVE', (0, 0), (-1, 0), 1, colors.HexColor('#E0E0E0')),
+        ]),
+        # White header; the row backgrounds are added per criterion
+        'levels_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.white),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('PADDING', (0, 0), (-1, -1), 6),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#BDC3C7')),
+            ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#2C3E50')),
+        ]),
+        'selected_level_background': colors.HexColor('#D5F4E6'),
+        'striped_level_background': colors.HexColor('#F8F9FA'),
+    }
+
+
+def generate_assessment_pdf(file_path, assessment_data):
+    """Generate a PDF report of the assessment with table-formatted achievement levels."""
+    if not _HAS_REPORTLAB:
+        print("Error generating PDF: reportlab is not installed")
+        return False
+
+    try:
+        # Create the PDF document with margins
+        doc = SimpleDocTemplate(
+            file_path,
+            pagesize=letter,
+            leftMargin=0.75 * inch,
+            rightMargin=0.75 * inch,
+            topMargin=0.75 * inch,
+            bottomMargin=0.75 * inch
         )
+        styles = _pdf_styles()
+        title_style = styles['title']
+        heading_style = styles['heading']
+        subheading_style = styles['subheading']
+        normal_style = styles['normal']
+        small_style = styles['small']
+        desc_style = styles['criterion_description']
+        comments_style = styles['comments']
+        score_box_style = styles['score_box']
+        comments_box_style = styles['comments_box']
+        separator_style = styles['separator']
+        levels_table_style = styles['levels_table']
+        selected_level_background = styles['selected_level_background']
+        striped_level_background = styles['striped_level_background']
 
         # Start building the document content
         content = []
@@ -159,17 +279,7 @@ def generate_assessment_pdf(file_path, assessment_data):
         ]
 
         summary_table = Table(summary_data, colWidths=[1.5 * inch, 2 * inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ECF0F1')),
-            ('BACKGROUND', (1, 0), (1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('PADDING', (0, 0), (-1, -1), 8),
-        ]))
+        summary_table.setStyle(styles['summary_table'])
 
         content.append(summary_table)
         content.append(Spacer(1, 0.25 * inch))
@@ -194,9 +304,12 @@ def generate_assessment_pdf(file_path, assessment_data):
             Paragraph("<b>Status</b>", normal_style)
         ]]
 
-        sorted_summary = sorted(
-            assessment_data['question_summary'],
-            key=lambda x: (not x['counted'], x['question'])
+        # Counted questions first, each group in question order
+        question_summary = assessment_data['question_summary']
+        by_question = itemgetter('question')
+        sorted_summary = (
+            sorted((q for q in question_summary if q['counted']), key=by_question)
+            + sorted((q for q in question_summary if not q['counted']), key=by_question)
         )
 
         for q_summary in sorted_summary:
@@ -222,21 +335,7 @@ def generate_assessment_pdf(file_path, assessment_data):
             ])
 
         q_summary_table = Table(question_summary_data, colWidths=[1.2 * inch, 1 * inch, 1 * inch, 1.5 * inch])
-        q_summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.white),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('TOPPADDING', (0, 0), (-1, 0), 10),
-            ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#34495E')),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#BDC3C7')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F8F9FA')]),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('PADDING', (0, 1), (-1, -1), 6),
-        ]))
+        q_summary_table.setStyle(styles['question_summary_table'])
 
         content.append(q_summary_table)
         content.append(Spacer(1, 0.3 * inch))
@@ -254,13 +353,17 @@ def generate_assessment_pdf(file_path, assessment_data):
                     question_criteria[q_num] = []
                 question_criteria[q_num].append(criterion)
 
+        # The question lists come from JSON, so check membership in sets
+        selected_questions = frozenset(assessment_data['selected_questions'])
+        counted_questions = frozenset(assessment_data['counted_questions'])
+
         # Process each question
-        for q_num in sorted(question_criteria.keys()):
-            if q_num not in assessment_data['selected_questions']:
+        for q_num in sorted(question_criteria):
+            if q_num not in selected_questions:
                 continue
 
             # Question header
-            if q_num in assessment_data['counted_questions']:
+            if q_num in counted_questions:
                 status_badge = '<font color="#27AE60">✓ COUNTED</font>'
             else:
                 status_badge = '<font color="#F39C12">NOT COUNTED</font>'
@@ -280,16 +383,9 @@ def generate_assessment_pdf(file_path, assessment_data):
 
                 criterion_elements.append(Paragraph(f"<b>{clean_text_for_pdf(title)}</b>", normal_style))
 
-                if 'description' in criterion and criterion['description']:
-                    desc_style = ParagraphStyle(
-                        'CriterionDesc',
-                        parent=normal_style,
-                        fontSize=10,
-                        textColor=colors.HexColor('#7F8C8D'),
-                        leftIndent=10
-                    )
+                if description := criterion.get('description'):
                     criterion_elements.append(
-                        Paragraph(f"<i>{clean_text_for_pdf(criterion['description'])}</i>", desc_style))
+                        Paragraph(f"<i>{clean_text_for_pdf(description)}</i>", desc_style))
 
                 criterion_elements.append(Spacer(1, 0.08 * inch))
 
@@ -300,21 +396,13 @@ def generate_assessment_pdf(file_path, assessment_data):
                 ]]
 
                 score_table = Table(score_data, colWidths=[1.2 * inch, 1 * inch])
-                score_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#ECF0F1')),
-                    ('BACKGROUND', (1, 0), (1, 0), colors.white),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
-                    ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-                    ('ALIGN', (1, 0), (1, 0), 'CENTER'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('PADDING', (0, 0), (-1, -1), 6),
-                ]))
+                score_table.setStyle(score_box_style)
 
                 criterion_elements.append(score_table)
                 criterion_elements.append(Spacer(1, 0.1 * inch))
 
                 # Achievement levels table (if available)
-                if 'levels' in criterion and criterion['levels']:
+                if levels := criterion.get('levels'):
                     levels_header = Paragraph("<b>Achievement Levels:</b>", normal_style)
                     criterion_elements.append(levels_header)
                     criterion_elements.append(Spacer(1, 0.05 * inch))
@@ -326,8 +414,9 @@ def generate_assessment_pdf(file_path, assessment_data):
                     ]]
 
                     selected_level = criterion.get('selected_level', '')
+                    selected_rows = set()
 
-                    for level in criterion['levels']:
+                    for row, level in enumerate(levels, start=1):
                         level_title = level.get('title', '')
                         level_points = level.get('points', 0)
                         level_desc = level.get('description', '')
@@ -335,6 +424,8 @@ def generate_assessment_pdf(file_path, assessment_data):
                         # Check if this level was selected
                         level_name = level_title.split('(')[0].strip()
                         is_selected = selected_level and level_name in selected_level
+                        if is_selected:
+                            selected_rows.add(row)
 
                         if is_selected:
                             level_text = f'<b><font color="#27AE60">➤ {clean_text_for_pdf(level_title)}</font></b>'
@@ -350,67 +441,37 @@ def generate_assessment_pdf(file_path, assessment_data):
                     # Calculate column widths
                     levels_table = Table(levels_data, colWidths=[1.8 * inch, 0.6 * inch, 4.3 * inch])
 
-                    # Build style with WHITE header and row backgrounds
-                    table_style = [
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.white),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('PADDING', (0, 0), (-1, -1), 6),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#BDC3C7')),
-                        ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#2C3E50')),
-                    ]
-
-                    # Add row backgrounds for selected level
-                    for i, level in enumerate(criterion['levels'], start=1):
-                        level_title = level.get('title', '')
-                        level_name = level_title.split('(')[0].strip()
-                        is_selected = selected_level and level_name in selected_level
-
-                        if is_selected:
-                            table_style.append(('BACKGROUND', (0, i), (-1, i), colors.HexColor('#D5F4E6')))
+                    # Shared header and grid style, then the row backgrounds
+                    # for the selected level (matched in the loop above)
+                    levels_table.setStyle(levels_table_style)
+                    row_backgrounds = []
+                    for i in range(1, len(levels) + 1):
+                        if i in selected_rows:
+                            row_backgrounds.append(('BACKGROUND', (0, i), (-1, i), selected_level_background))
                         else:
                             if i % 2 == 0:
-                                table_style.append(('BACKGROUND', (0, i), (-1, i), colors.HexColor('#F8F9FA')))
-
-                    levels_table.setStyle(TableStyle(table_style))
+                                row_backgrounds.append(('BACKGROUND', (0, i), (-1, i), striped_level_background))
+                    if row_backgrounds:
+                        levels_table.setStyle(row_backgrounds)
                     criterion_elements.append(levels_table)
                     criterion_elements.append(Spacer(1, 0.1 * inch))
 
                 # Comments section
-                if 'comments' in criterion and criterion['comments']:
+                if comments := criterion.get('comments'):
                     comments_header = Paragraph("<b>Instructor Feedback:</b>", normal_style)
                     criterion_elements.append(comments_header)
 
                     # Clean the comments text
-                    comments_text = clean_text_for_pdf(criterion['comments'])
+                    comments_text = clean_text_for_pdf(comments)
 
                     # Convert newlines to <br/> tags
                     comments_text = comments_text.replace('\n', '<br/>')
 
-                    comments_style = ParagraphStyle(
-                        'Comments',
-                        parent=normal_style,
-                        fontSize=10,
-                        leftIndent=10,
-                        rightIndent=10,
-                        spaceBefore=4,
-                        spaceAfter=4,
-                        textColor=colors.HexColor('#2C3E50')
-                    )
-
                     # Create a background box for comments
                     try:
                         comments_para = Paragraph(comments_text, comments_style)
                         comments_table = Table([[comments_para]], colWidths=[6.7 * inch])
-                        comments_table.setStyle(TableStyle([
-                            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#FEF9E7')),
-                            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#F39C12')),
-                            ('PADDING', (0, 0), (-1, -1), 10),
-                        ]))
+                        comments_table.setStyle(comments_box_style)
                         criterion_elements.append(comments_table)
                     except Exception as e:
                         # Fallback: just add as plain text if paragraph fails
@@ -422,9 +483,7 @@ def generate_assessment_pdf(file_path, assessment_data):
 
                 # Add separator line between criteria
                 separator = Table([['']], colWidths=[6.7 * inch])
-                separator.setStyle(TableStyle([
-                    ('LINEABOVE', (0, 0), (-1, 0), 1, colors.HexColor('#E0E0E0')),
-                ]))
+                separator.setStyle(separator_style)
                 criterion_elements.append(separator)
                 criterion_elements.append(Spacer(1, 0.1 * inch))
 
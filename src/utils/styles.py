@@ -18,6 +18,263 @@ COLORS = {
     "info": QColor(3, 169, 244)  # Light Blue
 }
 
+# Main window widgets, matched by objectName (installed once per application)
+MAIN_WINDOW_QSS = f"""
+    QFrame#mainDivider {{
+        background-color: {COLORS['divider'].name()};
+    }}
+    QLabel#fieldLabel {{
+        color: #757575;
+        font-size: 12px;
+    }}
+    QGroupBox#questionSelectionGroup {{
+        background-color: white;
+        border-radius: 4px;
+        margin-top: 16px;
+    }}
+    QScrollArea#criteriaScrollArea {{
+        background-color: transparent;
+        border: none;
+    }}
+    QWidget#scrollContent {{
+        background-color: white;
+        border-radius: 8px;
+        border: 1px solid #BDBDBD;
+    }}
+    QLabel#totalLabel {{
+        font-size: 14pt;
+        font-weight: bold;
+    }}
+    QLabel#totalLabel[scoreState="high"] {{
+        color: #4CAF50;
+    }}
+    QLabel#totalLabel[scoreState="medium"] {{
+        color: #FF9800;
+    }}
+    QLabel#totalLabel[scoreState="low"] {{
+        color: #F44336;
+    }}
+    QPushButton#clearButton {{
+        background-color: white;
+        color: #757575;
+        border: 1px solid #BDBDBD;
+        padding-left: 10px;
+    }}
+    QPushButton#clearButton:hover {{
+        background-color: #F5F5F5;
+    }}
+    QLabel#questionSelectionHint {{
+        font-weight: bold;
+        margin-bottom: 8px;
+    }}
+    QCheckBox#questionCheckBox {{
+        font-size: 12px;
+        padding: 4px;
+    }}
+    QCheckBox#questionCheckBox:hover {{
+        background-color: #F5F5F5;
+        border-radius: 4px;
+    }}
+    QPushButton#selectAllButton {{
+        background-color: white;
+        color: #3F51B5;
+        border: 1px solid #3F51B5;
+        min-width: 100px;
+    }}
+    QLabel#summaryPlaceholder {{
+        color: #757575;
+        font-style: italic;
+        padding: 20px;
+    }}
+    QTableWidget#questionSummaryTable {{
+        border: 1px solid #DDDDDD;
+        gridline-color: #DDDDDD;
+        background-color: white;
+    }}
+    #questionSummaryTable::item {{
+        padding: 6px;
+    }}
+    #questionSummaryTable QHeaderView::section {{
+        background-color: #F5F5F5;
+        padding: 6px;
+        font-weight: bold;
+        border: 1px solid #DDDDDD;
+    }}
+    QLabel#questionSummaryNote {{
+        color: #3F51B5;
+        font-style: italic;
+        background-color: #E8EAF6;
+        padding: 8px;
+        border-radius: 4px;
+    }}
+    QPushButton#selectNoneButton {{
+        background-color: white;
+        color: #757575;
+        border: 1px solid #BDBDBD;
+        min-width: 100px;
+    }}
+"""
+
+# CardWidget frame, title bar and content area, matched by objectName
+CARD_QSS = """
+    QFrame#CardWidgetRoot {
+        background-color: white;
+        border-radius: 4px;
+        border: 1px solid #EEEEEE;
+        margin: 8px 0px;
+    }
+    QFrame#CardTitleBar {
+        background-color: #3F51B5;
+        border-radius: 4px 4px 0 0;
+    }
+    QFrame#CardContent {
+        border-radius: 0 0 4px 4px;
+    }
+    QLabel[labelType="cardTitle"] {
+        font-size: 14px;
+        font-weight: bold;
+        color: white;
+        padding: 8px;
+    }
+"""
+
+# CriterionWidget and its children. Rules for inner containers use more
+# specific selectors so they override the card-wide QFrame rules, the same
+# way their own per-widget sheets used to.
+CRITERION_QSS = """
+    QFrame#criterionCard, #criterionCard QFrame {
+        background-color: white;
+        border-radius: 4px;
+        border: 1px solid #EEEEEE;
+        margin: 4px;
+        padding: 8px;
+    }
+    QFrame#criterionCard:hover, #criterionCard QFrame:hover {
+        border: 1px solid #BDBDBD;
+        background-color: #FAFAFA;
+    }
+    #criterionCard QLabel[labelType="criterionTitle"] {
+        font-size: 14px;
+        font-weight: bold;
+        color: #3F51B5;
+    }
+    #criterionCard QLabel[labelType="criterionDescription"] {
+        color: #757575;
+        font-style: italic;
+        margin-bottom: 8px;
+    }
+    #criterionCard QCheckBox {
+        padding: 4px;
+        border-radius: 4px;
+    }
+    #criterionCard QCheckBox:hover {
+        background-color: #F5F5F5;
+    }
+    #criterionCard QTextEdit {
+        border: 1px solid #BDBDBD;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    #criterionCard QTextEdit:focus {
+        border: 2px solid #3F51B5;
+    }
+    #criterionCard #pointsContainer, #criterionCard #pointsContainer QFrame {
+        background-color: #F5F5F5;
+        border-radius: 4px;
+        border: none;
+        margin: 0px;
+        padding: 8px;
+    }
+    #criterionCard #pointsLabel {
+        font-weight: bold;
+    }
+    #criterionCard QGroupBox {
+        font-weight: bold;
+        border: 1px solid #BDBDBD;
+        border-radius: 4px;
+        margin-top: 16px;
+        padding-top: 8px;
+    }
+    #criterionCard QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    #criterionCard #levelRow, #criterionCard #levelRow QFrame {
+        border: none;
+        border-radius: 0px;
+        margin: 0px;
+        padding: 0px;
+    }
+    #criterionCard #levelRow:hover, #criterionCard #levelRow QFrame:hover {
+        background-color: #F5F5F5;
+    }
+    #criterionCard #levelRow QCheckBox {
+        font-weight: bold;
+    }
+    #criterionCard #levelRow #levelDescription {
+        color: #757575;
+        padding-left: 24px;
+        font-size: 12px;
+    }
+"""
+
+# HeaderWidget: white bar with the app title
+HEADER_QSS = """
+    #appHeader, #appHeader * {
+        background-color: white;
+        border-bottom: 1px solid #BDBDBD;
+    }
+    #appHeader #appTitle {
+        color: #3F51B5;
+    }
+"""
+
+# StatusBarWidget labels (the bar colors come from the main stylesheet)
+STATUS_BAR_QSS = """
+    #appStatusBar {
+        background-color: #3F51B5;
+        color: white;
+    }
+    #appStatusBar QLabel {
+        color: white;
+        padding: 3px;
+    }
+    #appStatusBar #versionLabel {
+        color: rgba(255, 255, 255, 0.7);
+    }
+    #appStatusBar #autoSaveStatus[autoSaveState="error"] {
+        color: #FFCDD2;
+    }
+"""
+
+
+# (application id, stylesheet hash) pairs already appended by install_stylesheet
+_installed_sheets = set()
+
+
+def install_stylesheet(qss, app=None):
+    """
+    Append a stylesheet to the application-wide sheet, once.
+
+    Repeat calls are answered from a set of stylesheet hashes, so widgets can
+    call this from their constructors without Qt re-parsing the sheet.
+
+    Args:
+        qss (str): Stylesheet to add
+        app (QApplication, optional): Defaults to the running application
+    """
+    app = app or QApplication.instance()
+    if app is None:
+        return
+    key = (id(app), hash(qss))
+    if key in _installed_sheets:
+        return
+    current = app.styleSheet()
+    if qss not in current:
+        app.setStyleSheet(current + qss)
+    _installed_sheets.add(key)
+
 
 def apply_material_style(app):
     """Apply a Material Design-inspired style to the application."""
@@ -45,7 +302,8 @@ def apply_material_style(app):
     font = QFont("Segoe UI", 9)
     app.setFont(font)
 
-    # Apply stylesheet for more control
+    # Apply stylesheet for more control (this replaces any installed sheets)
+    _installed_sheets.clear()
     # NOTE: The problematic section with stray characters/comments has been removed below.
     app.setStyleSheet("""
         QPushButton {
@@ -25,7 +25,6 @@ Usage::
 """
 
 import argparse
-import glob
 import json
 import os
 import sys
@@ -35,7 +34,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 def load_assessments(directory: str, quiet: bool = False):
     assessments = []
-    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+    with os.scandir(directory) as entries:
+        paths = sorted(entry.path for entry in entries
+                       if entry.name.endswith(".json") and not entry.name.startswith(".")
+                       and entry.is_file())
+    for path in paths:
         try:
             with open(path) as fh:
                 data = json.load(fh)